@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('background.jpg', '.'), ('comidas.jpg', '.')],
-    hiddenimports=['win32print', 'win32ui'],
+    hiddenimports=['win32print', 'win32ui', 'categorias.bebidas', 'categorias.postres'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
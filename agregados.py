@@ -0,0 +1,213 @@
+"""
+Motor de agregación de cortes para reportes
+Los totales por día, semana ISO, mes y año se leen de los resúmenes que
+guardar_corte mantiene al día. El resultado se guarda en caché mientras
+no haya cortes nuevos (las ventas y la cola de impresión no cuentan).
+
+El reporte histórico (todos los años) se calcula desde los cortes crudos
+con historico(); con muchos cortes usa NumPy si está instalado.
+"""
+import calendar
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+import almacen
+
+# Con pocos cortes el ciclo normal es más rápido que armar arreglos
+MIN_COLUMNAR = 2000
+_EPOCA = date(1970, 1, 1)
+
+_np = {}
+
+
+def _numpy():
+    """NumPy, importado solo si un reporte llega a necesitarlo (o None)"""
+    if "modulo" not in _np:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _np["modulo"] = numpy
+    return _np["modulo"]
+
+
+class Agregados:
+    """Totales de venta agrupados por periodo"""
+
+    def __init__(self):
+        self.dias = {}       # date -> total
+        self.semanas = {}    # (año ISO, semana ISO) -> total
+        self.meses = {}      # (año, mes) -> total
+        self.anios = {}      # año -> total
+        self._fechas = None  # índice ordenado de self.dias
+
+    def agregar(self, fecha, total):
+        semana = fecha.isocalendar()[:2]
+        mes = (fecha.year, fecha.month)
+
+        self.dias[fecha] = self.dias.get(fecha, 0) + total
+        self.semanas[semana] = self.semanas.get(semana, 0) + total
+        self.meses[mes] = self.meses.get(mes, 0) + total
+        self.anios[fecha.year] = self.anios.get(fecha.year, 0) + total
+        self._fechas = None
+
+    def dias_entre(self, inicio, fin):
+        """
+        [(fecha, total)] de inicio a fin (inclusivos), en orden.
+        Búsqueda binaria sobre el índice ordenado de fechas: O(log n + k).
+        """
+        if self._fechas is None:
+            self._fechas = sorted(self.dias)
+        desde = bisect_left(self._fechas, inicio)
+        hasta = bisect_right(self._fechas, fin)
+        return [(f, self.dias[f]) for f in self._fechas[desde:hasta]]
+
+
+def construir(cortes):
+    """Una sola pasada sobre cortes crudos (reportes fuera de los resúmenes)"""
+    if len(cortes) >= MIN_COLUMNAR and _numpy() is not None:
+        return construir_columnar(
+            [c["fecha"] for c in cortes],
+            [c["total_vendido"] for c in cortes]
+        )
+
+    agregados = Agregados()
+    fechas = {}  # cada fecha de texto se convierte una sola vez
+
+    for corte in cortes:
+        texto = corte["fecha"]
+        fecha = fechas.get(texto)
+        if fecha is None:
+            fecha = fechas[texto] = date.fromisoformat(texto)
+        agregados.agregar(fecha, corte["total_vendido"])
+
+    return agregados
+
+
+def construir_columnar(fechas, totales):
+    """
+    Misma agregación que construir(), vectorizada con NumPy:
+    fechas como datetime64[D] y totales como float64.
+    """
+    np = _numpy()
+    dias = np.array(fechas, dtype="datetime64[D]")
+    montos = np.asarray(totales, dtype=np.float64)
+    agregados = Agregados()
+    if not len(dias):
+        return agregados
+
+    # Días: índice entero desde el primer día y suma con bincount
+    num = dias.astype(np.int64)
+    base = num.min()
+    indice = num - base
+    sumas = np.bincount(indice, weights=montos)
+    presentes = np.flatnonzero(np.bincount(indice))
+    for i in presentes:
+        agregados.dias[_EPOCA + timedelta(days=int(base + i))] = float(sumas[i])
+
+    # Semanas ISO: agrupar por el lunes de cada semana (1970-01-01 fue jueves)
+    lunes = num - (num + 3) % 7
+    base_lunes = lunes.min()
+    indice = (lunes - base_lunes) // 7
+    sumas = np.bincount(indice, weights=montos)
+    for i in np.flatnonzero(np.bincount(indice)):
+        inicio = _EPOCA + timedelta(days=int(base_lunes + 7 * i))
+        agregados.semanas[inicio.isocalendar()[:2]] = float(sumas[i])
+
+    # Meses y años: ordenar y sumar tramos contiguos con reduceat
+    orden = np.argsort(dias, kind="stable")
+    montos_ordenados = montos[orden]
+    for unidad, destino in (("M", agregados.meses), ("Y", agregados.anios)):
+        periodos = dias[orden].astype(f"datetime64[{unidad}]")
+        tramos = np.flatnonzero(
+            np.concatenate(([True], periodos[1:] != periodos[:-1]))
+        )
+        sumas = np.add.reduceat(montos_ordenados, tramos)
+        for inicio, suma in zip(periodos[tramos], sumas):
+            d = inicio.astype("datetime64[D]").item()
+            llave = (d.year, d.month) if unidad == "M" else d.year
+            destino[llave] = float(suma)
+
+    return agregados
+
+
+def historico(desde=None, hasta=None):
+    """
+    Agregados calculados desde los cortes crudos de un rango de fechas.
+    Para reportes de varios años o escenarios que no cubren los resúmenes.
+    """
+    filas = almacen.fechas_y_totales(desde, hasta)
+    if len(filas) >= MIN_COLUMNAR and _numpy() is not None:
+        return construir_columnar(
+            [fecha for fecha, _ in filas],
+            [total for _, total in filas]
+        )
+    return construir([
+        {"fecha": fecha, "total_vendido": total} for fecha, total in filas
+    ])
+
+
+def desde_resumen(filas):
+    """Arma los agregados a partir de la tabla de resúmenes (O(periodos))"""
+    agregados = Agregados()
+
+    for fila in filas:
+        periodo, clave, total = fila["periodo"], fila["clave"], fila["total"]
+        if periodo == "dia":
+            agregados.dias[date.fromisoformat(clave)] = total
+        elif periodo == "semana":
+            anio, semana = clave.split("-W")
+            agregados.semanas[(int(anio), int(semana))] = total
+        elif periodo == "mes":
+            anio, mes = clave.split("-")
+            agregados.meses[(int(anio), int(mes))] = total
+        elif periodo == "anio":
+            agregados.anios[int(clave)] = total
+
+    return agregados
+
+
+# =========================
+# CACHÉ
+# =========================
+_lock = threading.Lock()
+_cache = {"firma": None, "agregados": None}
+
+
+def obtener():
+    """Agregados actuales; solo se recalculan si hubo cortes nuevos"""
+    with _lock:
+        firma = almacen.version_cortes()
+        if _cache["agregados"] is None or _cache["firma"] != firma:
+            _cache["agregados"] = desde_resumen(almacen.listar_resumen())
+            _cache["firma"] = firma
+        return _cache["agregados"]
+
+
+# =========================
+# CONSULTAS
+# =========================
+def totales_hoy(agregados, hoy=None):
+    hoy = hoy or date.today()
+    return {
+        "dia": agregados.dias.get(hoy, 0),
+        "semana": agregados.semanas.get(hoy.isocalendar()[:2], 0),
+        "mes": agregados.meses.get((hoy.year, hoy.month), 0)
+    }
+
+
+def por_mes(agregados, anio, mes):
+    """Total del mes y desglose por día del mes y por semana ISO"""
+    ultimo = calendar.monthrange(anio, mes)[1]
+    total_mes = 0
+    por_dia = {}
+    por_semana = {}
+
+    for fecha, total in agregados.dias_entre(date(anio, mes, 1), date(anio, mes, ultimo)):
+        total_mes += total
+        por_dia[fecha.day] = por_dia.get(fecha.day, 0) + total
+        semana = fecha.isocalendar()[1]
+        por_semana[semana] = por_semana.get(semana, 0) + total
+
+    return total_mes, por_dia, por_semana
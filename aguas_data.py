@@ -1,16 +0,0 @@
-import json
-from pathlib import Path
-
-ARCHIVO = Path("aguas.json")
-
-
-def cargar_aguas():
-    if ARCHIVO.exists():
-        with open(ARCHIVO, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
-
-
-def guardar_aguas(data):
-    with open(ARCHIVO, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
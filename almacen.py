@@ -0,0 +1,532 @@
+"""
+Almacén SQLite único para ventas, cortes, menú y configuración
+Reemplaza los archivos JSON que se releían completos en cada acceso.
+La base usa modo WAL e índices por fecha y categoría.
+"""
+import json
+import sqlite3
+import sys
+import threading
+from datetime import date
+from pathlib import Path
+
+ARCHIVO_DB = Path("comalito.db")
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS cortes (
+    id INTEGER PRIMARY KEY,
+    fecha TEXT NOT NULL,
+    hora TEXT NOT NULL,
+    total_vendido REAL NOT NULL,
+    tickets_pagados INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cortes_fecha ON cortes(fecha);
+
+CREATE TABLE IF NOT EXISTS ventas (
+    id INTEGER PRIMARY KEY,
+    fecha TEXT NOT NULL,
+    hora TEXT NOT NULL,
+    ticket INTEGER,
+    total REAL NOT NULL,
+    items TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ventas_fecha ON ventas(fecha);
+
+CREATE TABLE IF NOT EXISTS menu (
+    categoria TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    precio REAL NOT NULL,
+    orden INTEGER NOT NULL,
+    PRIMARY KEY (categoria, nombre)
+);
+CREATE INDEX IF NOT EXISTS idx_menu_categoria ON menu(categoria, orden);
+
+-- Totales precalculados por periodo; se actualizan en cada corte
+CREATE TABLE IF NOT EXISTS resumen (
+    periodo TEXT NOT NULL,
+    clave TEXT NOT NULL,
+    total REAL NOT NULL,
+    tickets INTEGER NOT NULL,
+    PRIMARY KEY (periodo, clave)
+);
+
+-- Trabajos de impresión pendientes (no se pierden si la impresora está apagada)
+CREATE TABLE IF NOT EXISTS cola_impresion (
+    id INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    datos TEXT NOT NULL,
+    intentos INTEGER NOT NULL DEFAULT 0,
+    siguiente REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cola_siguiente ON cola_impresion(siguiente);
+
+-- Trabajos que ya no se reintentan (datos dañados o demasiados intentos)
+CREATE TABLE IF NOT EXISTS impresiones_apartadas (
+    id INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    datos TEXT NOT NULL,
+    intentos INTEGER NOT NULL,
+    motivo TEXT NOT NULL,
+    hora REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS config (
+    clave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+"""
+
+# Archivos JSON que se importan la primera vez que se crea la base
+MENUS_JSON = {
+    "guisos": Path("guisos.json"),
+    "aguas": Path("aguas.json"),
+    "refrescos": Path("refrescos.json"),
+    "postres": Path("postres.json"),
+}
+CORTES_JSON = [Path("ventas.json"), Path("registros/cortes.json")]
+CONFIG_JSON = {"impresora": Path("printer_config.json")}
+
+_local = threading.local()
+_lock_migracion = threading.Lock()
+
+
+# =========================
+# CONEXIÓN
+# =========================
+def conexion():
+    """Conexión SQLite del hilo actual (una por hilo)"""
+    con = getattr(_local, "con", None)
+    if con is None:
+        con = sqlite3.connect(ARCHIVO_DB, timeout=10)
+        con.row_factory = sqlite3.Row
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        con.executescript(ESQUEMA)
+        _migrar_si_hace_falta(con)
+        _local.con = con
+    return con
+
+
+def _migrar_si_hace_falta(con):
+    with _lock_migracion:
+        fila = con.execute(
+            "SELECT valor FROM config WHERE clave = '_migrado'"
+        ).fetchone()
+        if fila is None:
+            migrar_json(con)
+
+        # Bases creadas antes de existir la tabla de resúmenes
+        fila = con.execute(
+            "SELECT valor FROM config WHERE clave = '_resumenes'"
+        ).fetchone()
+        if fila is None:
+            reconstruir_resumenes(con)
+
+
+def _filtro_fechas(desde, hasta):
+    """WHERE por rango de fechas (usa el índice de fecha)"""
+    condiciones, params = [], []
+    if desde:
+        condiciones.append("fecha >= ?")
+        params.append(desde)
+    if hasta:
+        condiciones.append("fecha <= ?")
+        params.append(hasta)
+    if not condiciones:
+        return "", params
+    return " WHERE " + " AND ".join(condiciones), params
+
+
+# =========================
+# CORTES
+# =========================
+def agregar_corte(corte):
+    """Guarda el corte y actualiza sus resúmenes en la misma transacción"""
+    con = conexion()
+    with con:
+        con.execute(
+            "INSERT INTO cortes (fecha, hora, total_vendido, tickets_pagados) "
+            "VALUES (:fecha, :hora, :total_vendido, :tickets_pagados)",
+            corte
+        )
+        con.executemany(
+            "INSERT INTO resumen (periodo, clave, total, tickets) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (periodo, clave) DO UPDATE SET "
+            "total = total + excluded.total, tickets = tickets + excluded.tickets",
+            [
+                (periodo, clave, corte["total_vendido"], corte["tickets_pagados"])
+                for periodo, clave in claves_periodo(corte["fecha"]).items()
+            ]
+        )
+
+
+def listar_cortes(desde=None, hasta=None):
+    """Cortes en orden cronológico; desde/hasta son 'YYYY-MM-DD' inclusivos"""
+    where, params = _filtro_fechas(desde, hasta)
+    sql = (
+        "SELECT fecha, hora, total_vendido, tickets_pagados FROM cortes"
+        + where + " ORDER BY fecha, hora, id"
+    )
+    return [dict(fila) for fila in conexion().execute(sql, params)]
+
+
+def cortes_between(start, end):
+    """
+    Cortes con fecha entre start y end (inclusivos, date o 'YYYY-MM-DD').
+    Usa el índice ordenado idx_cortes_fecha: búsqueda binaria, O(log n + k).
+    """
+    start = start.isoformat() if isinstance(start, date) else start
+    end = end.isoformat() if isinstance(end, date) else end
+    return listar_cortes(start, end)
+
+
+def fechas_y_totales(desde=None, hasta=None):
+    """Solo (fecha, total_vendido) de los cortes, para reportes por columnas"""
+    where, params = _filtro_fechas(desde, hasta)
+    return [
+        tuple(fila) for fila in conexion().execute(
+            "SELECT fecha, total_vendido FROM cortes" + where
+            + " ORDER BY fecha", params
+        )
+    ]
+
+
+# =========================
+# RESÚMENES POR PERIODO
+# =========================
+def claves_periodo(fecha):
+    """
+    Claves de resumen de una fecha 'YYYY-MM-DD':
+    dia '2026-01-04', semana ISO '2026-W01', mes '2026-01', anio '2026'
+    """
+    d = date.fromisoformat(fecha)
+    anio_iso, semana, _ = d.isocalendar()
+    return {
+        "dia": fecha,
+        "semana": f"{anio_iso}-W{semana:02d}",
+        "mes": fecha[:7],
+        "anio": fecha[:4],
+    }
+
+
+def version_cortes():
+    """Cambia cada vez que se guarda un corte (y con él los resúmenes)"""
+    return tuple(conexion().execute(
+        "SELECT MAX(id), COUNT(*) FROM cortes"
+    ).fetchone())
+
+
+def listar_resumen(periodo=None):
+    """Filas (periodo, clave, total, tickets) de los resúmenes"""
+    sql = "SELECT periodo, clave, total, tickets FROM resumen"
+    params = []
+    if periodo:
+        sql += " WHERE periodo = ?"
+        params.append(periodo)
+    return [dict(fila) for fila in conexion().execute(sql, params)]
+
+
+def total_resumen(periodo, clave):
+    fila = conexion().execute(
+        "SELECT total FROM resumen WHERE periodo = ? AND clave = ?",
+        (periodo, clave)
+    ).fetchone()
+    return fila["total"] if fila else 0
+
+
+def reconstruir_resumenes(con=None):
+    """Regenera todos los resúmenes a partir de los cortes originales"""
+    con = con or conexion()
+
+    acumulado = {}
+    claves = {}  # cada fecha se procesa una sola vez
+    for fecha, total, tickets in con.execute(
+        "SELECT fecha, total_vendido, tickets_pagados FROM cortes"
+    ):
+        if fecha not in claves:
+            claves[fecha] = claves_periodo(fecha).items()
+        for llave in claves[fecha]:
+            suma = acumulado.setdefault(llave, [0, 0])
+            suma[0] += total
+            suma[1] += tickets
+
+    with con:
+        con.execute("DELETE FROM resumen")
+        con.executemany(
+            "INSERT INTO resumen (periodo, clave, total, tickets) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (periodo, clave, total, tickets)
+                for (periodo, clave), (total, tickets) in acumulado.items()
+            ]
+        )
+        con.execute(
+            "INSERT OR REPLACE INTO config (clave, valor) VALUES ('_resumenes', 'true')"
+        )
+
+    return len(acumulado)
+
+
+# =========================
+# VENTAS (UN REGISTRO POR TICKET)
+# =========================
+def agregar_ventas(ventas):
+    """Inserta un lote de ventas en una sola transacción"""
+    con = conexion()
+    with con:
+        _insertar_ventas(con, ventas)
+
+
+def _insertar_ventas(con, ventas):
+    con.executemany(
+        "INSERT INTO ventas (fecha, hora, ticket, total, items) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (v["fecha"], v["hora"], v.get("ticket"), v["total"],
+             json.dumps(v.get("items", []), ensure_ascii=False))
+            for v in ventas
+        ]
+    )
+
+
+def listar_ventas(desde=None, hasta=None):
+    where, params = _filtro_fechas(desde, hasta)
+    sql = (
+        "SELECT fecha, hora, ticket, total, items FROM ventas"
+        + where + " ORDER BY fecha, hora, id"
+    )
+
+    ventas = []
+    for fila in conexion().execute(sql, params):
+        venta = dict(fila)
+        venta["items"] = json.loads(venta["items"])
+        ventas.append(venta)
+    return ventas
+
+
+# =========================
+# MENÚ
+# =========================
+def cargar_menu(categoria):
+    """Devuelve {nombre: precio} en el orden en que se capturó"""
+    filas = conexion().execute(
+        "SELECT nombre, precio FROM menu WHERE categoria = ? ORDER BY orden",
+        (categoria,)
+    )
+    return {fila["nombre"]: fila["precio"] for fila in filas}
+
+
+def _reemplazar_menu(con, categoria, data):
+    con.execute("DELETE FROM menu WHERE categoria = ?", (categoria,))
+    con.executemany(
+        "INSERT INTO menu (categoria, nombre, precio, orden) "
+        "VALUES (?, ?, ?, ?)",
+        [
+            (categoria, nombre, precio, orden)
+            for orden, (nombre, precio) in enumerate(data.items())
+        ]
+    )
+
+
+def guardar_menu(categoria, data):
+    """Reemplaza completa la sección del menú"""
+    con = conexion()
+    with con:
+        _reemplazar_menu(con, categoria, data)
+
+
+# =========================
+# COLA DE IMPRESIÓN
+# =========================
+def encolar_impresion(tipo, datos, cuando):
+    con = conexion()
+    with con:
+        cur = con.execute(
+            "INSERT INTO cola_impresion (tipo, datos, siguiente) VALUES (?, ?, ?)",
+            (tipo, json.dumps(datos, ensure_ascii=False), cuando)
+        )
+    return cur.lastrowid
+
+
+def _trabajo(fila):
+    trabajo = dict(fila)
+    try:
+        trabajo["datos"] = json.loads(trabajo["datos"])
+    except ValueError:
+        # Un trabajo dañado no debe trabar la cola: la cola lo aparta
+        trabajo["datos"] = None
+    return trabajo
+
+
+def siguiente_impresion():
+    """Trabajo pendiente más próximo (el más antiguo primero) o None"""
+    fila = conexion().execute(
+        "SELECT id, tipo, datos, intentos, siguiente FROM cola_impresion "
+        "ORDER BY siguiente, id LIMIT 1"
+    ).fetchone()
+    if fila is None:
+        return None
+    return _trabajo(fila)
+
+
+def impresiones_listas(ahora, limite):
+    """
+    Trabajos nuevos cuyo turno ya llegó, en orden de llegada (para
+    imprimir en lote). Los reintentos no entran: se imprimen solos.
+    """
+    filas = conexion().execute(
+        "SELECT id, tipo, datos, intentos, siguiente FROM cola_impresion "
+        "WHERE siguiente <= ? AND intentos = 0 ORDER BY siguiente, id LIMIT ?",
+        (ahora, limite)
+    ).fetchall()
+    return [_trabajo(fila) for fila in filas]
+
+
+def reprogramar_impresion(trabajo_id, intentos, cuando):
+    con = conexion()
+    with con:
+        con.execute(
+            "UPDATE cola_impresion SET intentos = ?, siguiente = ? WHERE id = ?",
+            (intentos, cuando, trabajo_id)
+        )
+
+
+def borrar_impresion(*trabajo_ids):
+    con = conexion()
+    with con:
+        con.executemany(
+            "DELETE FROM cola_impresion WHERE id = ?",
+            [(i,) for i in trabajo_ids]
+        )
+
+
+def apartar_impresion(trabajo_id, intentos, motivo, hora):
+    """Saca el trabajo de la cola y lo guarda entre los apartados"""
+    con = conexion()
+    with con:
+        con.execute(
+            "INSERT INTO impresiones_apartadas (tipo, datos, intentos, motivo, hora) "
+            "SELECT tipo, datos, ?, ?, ? FROM cola_impresion WHERE id = ?",
+            (intentos, motivo, hora, trabajo_id)
+        )
+        con.execute("DELETE FROM cola_impresion WHERE id = ?", (trabajo_id,))
+
+
+def contar_apartadas():
+    return conexion().execute(
+        "SELECT COUNT(*) FROM impresiones_apartadas"
+    ).fetchone()[0]
+
+
+# =========================
+# CONFIGURACIÓN
+# =========================
+def cargar_config(clave, default=None):
+    fila = conexion().execute(
+        "SELECT valor FROM config WHERE clave = ?", (clave,)
+    ).fetchone()
+    if fila is None:
+        return default
+    return json.loads(fila["valor"])
+
+
+def guardar_config(clave, valor):
+    con = conexion()
+    with con:
+        con.execute(
+            "INSERT OR REPLACE INTO config (clave, valor) VALUES (?, ?)",
+            (clave, json.dumps(valor, ensure_ascii=False))
+        )
+
+
+# =========================
+# MIGRACIÓN DESDE JSON
+# =========================
+def _leer_json(path):
+    """Contenido del archivo, o None si no existe o está dañado"""
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except ValueError as e:
+        # Un archivo truncado no debe impedir abrir la base
+        print(f"No se pudo importar {path}: {e}")
+        return None
+
+
+def migrar_json(con):
+    """
+    Importa una sola vez los archivos JSON existentes.
+    Los archivos originales no se modifican.
+    """
+    cortes = []
+    for path in CORTES_JSON:
+        cortes.extend(_leer_json(path) or [])
+
+    # registros/cortes.json y ventas.json pueden repetir cortes
+    vistos = set()
+    unicos = []
+    for c in cortes:
+        llave = (c["fecha"], c["hora"], c["total_vendido"], c["tickets_pagados"])
+        if llave not in vistos:
+            vistos.add(llave)
+            unicos.append(c)
+    unicos.sort(key=lambda c: (c["fecha"], c["hora"]))
+
+    with con:
+        con.executemany(
+            "INSERT INTO cortes (fecha, hora, total_vendido, tickets_pagados) "
+            "VALUES (:fecha, :hora, :total_vendido, :tickets_pagados)",
+            unicos
+        )
+
+        for categoria, path in MENUS_JSON.items():
+            data = _leer_json(path)
+            if not data:
+                continue
+            _reemplazar_menu(con, categoria, data)
+
+        for clave, path in CONFIG_JSON.items():
+            data = _leer_json(path)
+            if data:
+                con.execute(
+                    "INSERT OR REPLACE INTO config (clave, valor) VALUES (?, ?)",
+                    (clave, json.dumps(data, ensure_ascii=False))
+                )
+
+        con.execute(
+            "INSERT OR REPLACE INTO config (clave, valor) VALUES ('_migrado', 'true')"
+        )
+
+    return len(unicos)
+
+
+def compactar():
+    """Vuelca el WAL a la base y recupera espacio libre"""
+    con = conexion()
+    con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    con.execute("VACUUM")
+
+
+if __name__ == "__main__":
+    # Uso: python almacen.py [migrar|compactar|resumenes]
+    comando = sys.argv[1] if len(sys.argv) > 1 else ""
+
+    if comando == "migrar":
+        # conexion() migra automáticamente si la base es nueva
+        nueva = not ARCHIVO_DB.exists()
+        conexion()
+        if nueva:
+            print(f"Base creada e importada en {ARCHIVO_DB}")
+        else:
+            print(f"{ARCHIVO_DB} ya estaba migrada; no se importó nada")
+    elif comando == "compactar":
+        compactar()
+        print(f"{ARCHIVO_DB} compactada")
+    elif comando == "resumenes":
+        total = reconstruir_resumenes()
+        print(f"Resúmenes reconstruidos: {total} periodos")
+    else:
+        print("Uso: python almacen.py [migrar|compactar|resumenes]")
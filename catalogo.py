@@ -0,0 +1,62 @@
+"""
+Catálogo del menú en memoria
+Guisos, aguas, refrescos y postres se leen del almacén una sola vez y
+se sirven como copias inmutables; los diálogos abren sin tocar el disco.
+Al guardar desde Editar Menú se reemplaza la copia; los diálogos ya
+armados notan el cambio porque la sección es otro objeto.
+"""
+import threading
+from types import MappingProxyType
+
+import almacen
+
+CATEGORIAS = ("guisos", "aguas", "refrescos", "postres")
+
+# Si una sección está vacía se crea con estos valores
+POR_DEFECTO = {
+    "guisos": {
+        "Frijol con Queso": 0,
+        "Huevo verde": 0,
+        "Huevo rojo": 0,
+        "Chicharrón": 0,
+        "Deshebrada": 0,
+        "Picadillo": 0,
+        "Papa con chorizo": 0,
+        "Calabazas a la Mexicana": 0,
+        "Nopales a la Mexicana": 0
+    }
+}
+
+
+class Catalogo:
+    """Copias en memoria de cada sección del menú"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._secciones = {}   # categoria -> MappingProxyType {nombre: precio}
+
+    def obtener(self, categoria):
+        """{nombre: precio} de solo lectura; solo la primera vez lee el almacén"""
+        with self._lock:
+            seccion = self._secciones.get(categoria)
+            if seccion is not None:
+                return seccion
+
+            data = almacen.cargar_menu(categoria)
+            if not data and categoria in POR_DEFECTO:
+                data = dict(POR_DEFECTO[categoria])
+                almacen.guardar_menu(categoria, data)
+
+            seccion = self._secciones[categoria] = MappingProxyType(data)
+            return seccion
+
+    def guardar(self, categoria, data):
+        """Guarda la sección y reemplaza la copia en memoria"""
+        data = dict(data)
+        almacen.guardar_menu(categoria, data)
+
+        with self._lock:
+            self._secciones[categoria] = MappingProxyType(data)
+
+
+CATALOGO = Catalogo()
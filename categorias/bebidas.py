@@ -2,10 +2,11 @@ from PyQt5.QtWidgets import (
     QDialog, QPushButton, QVBoxLayout, QLabel, QFrame
 )
 from PyQt5.QtCore import Qt
+import tema
 
 
 class BebidasDialog(QDialog):
-    def __init__(self, parent):
+    def __init__(self, parent, edit_data=None, edit_row=None):
         super().__init__(parent)
 
         self.parent = parent
@@ -14,12 +15,7 @@ class BebidasDialog(QDialog):
         self.setFixedSize(420, 300)
 
         container = QFrame()
-        container.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 20px;
-            }
-        """)
+        tema.clase(container, "tarjeta")
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(30, 30, 30, 30)
@@ -27,25 +23,14 @@ class BebidasDialog(QDialog):
 
         title = QLabel("Bebidas")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 26px; font-weight: bold;")
+        tema.clase(title, "titulo")
 
         btn_aguas = QPushButton("🥤 Aguas de Sabor")
         btn_refrescos = QPushButton("🥤 Refrescos")
 
         for btn in (btn_aguas, btn_refrescos):
             btn.setFixedHeight(70)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #1a73e8;
-                    color: white;
-                    border-radius: 18px;
-                    font-size: 20px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #1558b0;
-                }
-            """)
+            tema.clase(btn, "opcion")
 
         btn_aguas.clicked.connect(self.open_aguas)
         btn_refrescos.clicked.connect(self.open_refrescos)
@@ -59,10 +44,11 @@ class BebidasDialog(QDialog):
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(container)
 
+    def preparar(self, edit_data=None, edit_row=None):
+        """Solo es un menú de opciones: no hay estado que reiniciar"""
+
     def open_aguas(self):
-        from categorias.aguas import AguasDialog
-        AguasDialog(self.parent).exec_()
+        self.parent.dialogos.abrir("aguas")
 
     def open_refrescos(self):
-        from categorias.refrescos import RefrescosDialog
-        RefrescosDialog(self.parent).exec_()
+        self.parent.dialogos.abrir("refrescos")
@@ -3,17 +3,16 @@ from PyQt5.QtWidgets import (
     QVBoxLayout, QFrame, QScrollArea, QWidget
 )
 from PyQt5.QtCore import Qt
-import json
-from pathlib import Path
-
-ARCH_POSTRES = Path("postres.json")
+from catalogo import CATALOGO
+import tema
 
 
 class PostresDialog(QDialog):
-    def __init__(self, parent):
+    def __init__(self, parent, edit_data=None, edit_row=None):
         super().__init__(parent)
 
         self.parent = parent
+        self.postres = None
 
         self.setWindowTitle("Postres")
         self.resize(420, 400)  # 👈 ya NO es fijo
@@ -22,12 +21,7 @@ class PostresDialog(QDialog):
         # CONTENEDOR PRINCIPAL
         # =========================
         container = QFrame()
-        container.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 20px;
-            }
-        """)
+        tema.clase(container, "tarjeta")
 
         main_layout = QVBoxLayout(container)
         main_layout.setContentsMargins(30, 30, 30, 30)
@@ -35,7 +29,7 @@ class PostresDialog(QDialog):
 
         title = QLabel("Postres")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 26px; font-weight: bold;")
+        tema.clase(title, "titulo")
 
         # =========================
         # SCROLL AREA
@@ -56,35 +50,34 @@ class PostresDialog(QDialog):
         wrapper = QVBoxLayout(self)
         wrapper.addWidget(container)
 
-        self.btn_style = """
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border-radius: 14px;
-                padding: 18px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1558b0;
-            }
-        """
-
-        self.cargar_postres()
+        self.preparar(edit_data, edit_row)
 
     # =========================
-    # CARGAR POSTRES DESDE JSON
+    # REABRIR
     # =========================
-    def cargar_postres(self):
-        if not ARCH_POSTRES.exists():
-            return
+    def preparar(self, edit_data=None, edit_row=None):
+        """Deja el diálogo listo para abrirse otra vez (nuevo o editando)"""
+        self.edit_data = edit_data
+        self.edit_row = edit_row
+
+        # Los botones solo se rehacen si cambió el menú
+        postres = CATALOGO.obtener("postres")
+        if postres is not self.postres:
+            self.postres = postres
+            self.cargar_postres()
 
-        with open(ARCH_POSTRES, "r", encoding="utf-8") as f:
-            postres = json.load(f)
+    # =========================
+    # CARGAR POSTRES DEL MENÚ
+    # =========================
+    def cargar_postres(self):
+        while self.scroll_layout.count():
+            item = self.scroll_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
 
-        for nombre, precio in postres.items():
+        for nombre, precio in self.postres.items():
             btn = QPushButton(f"{nombre}  ${precio}")
-            btn.setStyleSheet(self.btn_style)
+            tema.clase(btn, "postre")
             btn.setFixedHeight(60)
 
             btn.clicked.connect(
@@ -102,9 +95,12 @@ class PostresDialog(QDialog):
         data = {
             "categoria": "Postres",
             "tipo": tipo,
-            "qty": 1,
+            "qty": self.edit_data["qty"] if self.edit_data else 1,
             "price": price
         }
 
-        self.parent.add_product(data)
+        if self.edit_data:
+            self.parent.ticket.replace_item(self.edit_row, data)
+        else:
+            self.parent.add_product(data)
         self.accept()
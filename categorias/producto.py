@@ -0,0 +1,263 @@
+from PyQt5.QtWidgets import (
+    QDialog, QLabel, QPushButton,
+    QVBoxLayout, QHBoxLayout,
+    QComboBox, QFrame
+)
+from PyQt5.QtCore import Qt
+from catalogo import CATALOGO
+import tema
+
+
+# =========================
+# ESQUEMAS DE CATEGORÍA
+# =========================
+# titulo:          título del diálogo (por defecto, la categoría)
+# precio_base:     precio de la pieza
+# opciones:        sección del catálogo para el combo (None = sin combo)
+# etiqueta:        texto sobre el combo
+# precio:          "extra" = base + precio de la opción
+#                  "menu"  = el precio de la opción
+#                  "base"  = la opción no cambia el precio
+# contar_guisos:   segundo contador de guisos; cada guiso después del
+#                  primero cuesta precio_guiso
+# precio_total:    mostrar precio × cantidad en lugar del unitario
+ESQUEMAS = {
+    "gorditas": {
+        "categoria": "Gorditas", "precio_base": 16,
+        "opciones": "guisos", "etiqueta": "Tipo:", "precio": "extra"
+    },
+    "bocoles": {
+        "categoria": "Bocoles", "precio_base": 16,
+        "opciones": "guisos", "etiqueta": "Tipo:", "precio": "extra"
+    },
+    "quesadillas": {
+        "categoria": "Quesadillas", "precio_base": 15,
+        "opciones": "guisos", "etiqueta": "Tipo:", "precio": "extra"
+    },
+    "tacos_maiz": {
+        "categoria": "Tacos de Maiz", "precio_base": 16,
+        "opciones": "guisos", "etiqueta": "Guiso:", "precio": "extra"
+    },
+    "tacos_harina": {
+        "categoria": "Tacos de Harina", "precio_base": 17,
+        "opciones": "guisos", "etiqueta": "Guiso:", "precio": "extra"
+    },
+    "migadas": {
+        "categoria": "Migadas", "precio_base": 85,
+        "opciones": "guisos", "etiqueta": "Tipo:", "precio": "base",
+        "contar_guisos": True, "precio_guiso": 0, "precio_total": True,
+        "alto": 520
+    },
+    "big_quesadilla": {
+        "categoria": "Big Quesadilla", "precio_base": 45,
+        "opciones": None, "precio": "base", "precio_total": True
+    },
+    "aguas": {
+        "categoria": "Aguas", "titulo": "Aguas Naturales",
+        "opciones": "aguas", "etiqueta": "Sabor:", "precio": "menu"
+    },
+    "refrescos": {
+        "categoria": "Refrescos",
+        "opciones": "refrescos", "etiqueta": "Refresco:", "precio": "menu"
+    },
+}
+
+
+class ProductoDialog(QDialog):
+    """Diálogo de producto armado a partir de un esquema de categoría"""
+
+    def __init__(self, parent, esquema, edit_data=None, edit_row=None):
+        super().__init__(parent)
+
+        self.parent = parent
+        self.esquema = esquema
+        self.categoria = esquema["categoria"]
+        self.base_price = esquema.get("precio_base", 0)
+        self.opciones = None
+
+        titulo = esquema.get("titulo", self.categoria)
+        self.setWindowTitle(titulo)
+        self.setFixedSize(460, esquema.get("alto", 420))
+
+        self.qty = 1
+        self.guisos = 1
+
+        container = QFrame()
+        tema.clase(container, "tarjeta")
+
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(20)
+
+        title = QLabel(titulo)
+        title.setAlignment(Qt.AlignCenter)
+        tema.clase(title, "titulo")
+        layout.addWidget(title)
+
+        # -------- OPCIONES --------
+        self.type_box = None
+        if esquema.get("opciones"):
+            self.type_box = QComboBox()
+            tema.clase(self.type_box, "opciones")
+            self.type_box.currentTextChanged.connect(self.update_price)
+
+            layout.addWidget(QLabel(esquema.get("etiqueta", "Tipo:")))
+            layout.addWidget(self.type_box)
+
+        # -------- CONTADORES --------
+        layout.addWidget(QLabel("Cantidad:"))
+        contador, self.qty_label = self.counter("qty")
+        layout.addLayout(contador)
+
+        self.guisos_label = None
+        if esquema.get("contar_guisos"):
+            layout.addWidget(QLabel("Cantidad de guisos:"))
+            contador, self.guisos_label = self.counter("guisos")
+            layout.addLayout(contador)
+
+        # -------- PRECIO --------
+        self.price_label = QLabel()
+        self.price_label.setAlignment(Qt.AlignCenter)
+        tema.clase(self.price_label, "precio")
+
+        btn_add = QPushButton("AGREGAR AL TICKET")
+        btn_add.setFixedHeight(60)
+        tema.clase(btn_add, "primario")
+        btn_add.clicked.connect(self.confirm)
+
+        layout.addWidget(self.price_label)
+        layout.addStretch()
+        layout.addWidget(btn_add)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(container)
+
+        self.preparar(edit_data, edit_row)
+
+    # =========================
+    # CONTADOR + / -
+    # =========================
+    def counter(self, atributo):
+        layout = QHBoxLayout()
+        layout.setSpacing(25)
+
+        btn_minus = QPushButton("−")
+        btn_plus = QPushButton("+")
+
+        for btn in (btn_minus, btn_plus):
+            btn.setFixedSize(60, 60)
+            tema.clase(btn, "contador")
+
+        label = QLabel("1")
+        label.setAlignment(Qt.AlignCenter)
+        label.setFixedWidth(80)
+        tema.clase(label, "contador")
+
+        def cambiar(delta):
+            valor = max(1, getattr(self, atributo) + delta)
+            setattr(self, atributo, valor)
+            label.setText(str(valor))
+            self.update_price()
+
+        btn_minus.clicked.connect(lambda: cambiar(-1))
+        btn_plus.clicked.connect(lambda: cambiar(1))
+
+        layout.addStretch()
+        layout.addWidget(btn_minus)
+        layout.addWidget(label)
+        layout.addWidget(btn_plus)
+        layout.addStretch()
+
+        return layout, label
+
+    # =========================
+    # REABRIR
+    # =========================
+    def preparar(self, edit_data=None, edit_row=None):
+        """Deja el diálogo listo para abrirse otra vez (nuevo o editando)"""
+        self.edit_data = edit_data
+        self.edit_row = edit_row
+
+        if self.type_box is not None:
+            # Solo se rehace el combo si cambió el menú desde la última vez
+            opciones = CATALOGO.obtener(self.esquema["opciones"])
+            if opciones is not self.opciones:
+                self.opciones = opciones
+                self.type_box.blockSignals(True)
+                self.type_box.clear()
+                self.type_box.addItems(self.opciones.keys())
+                self.type_box.blockSignals(False)
+
+            # Con contador de guisos el tipo guardado lleva "(n guisos)"
+            tipo = edit_data["tipo"] if edit_data else None
+            if tipo and self.guisos_label is not None:
+                tipo = tipo.rsplit(" (", 1)[0]
+            if tipo in self.opciones:
+                self.type_box.setCurrentText(tipo)
+            else:
+                self.type_box.setCurrentIndex(0)
+
+        self.qty = edit_data["qty"] if edit_data else 1
+        self.qty_label.setText(str(self.qty))
+
+        if self.guisos_label is not None:
+            self.guisos = edit_data.get("guisos", 1) if edit_data else 1
+            self.guisos_label.setText(str(self.guisos))
+
+        self.update_price()
+
+    # =========================
+    # PRECIO
+    # =========================
+    def tipo(self):
+        if self.type_box is None:
+            return self.categoria
+        return self.type_box.currentText()
+
+    def unit_price(self):
+        modo = self.esquema.get("precio", "base")
+        if modo == "extra":
+            price = self.base_price + self.opciones[self.tipo()]
+        elif modo == "menu":
+            price = self.opciones[self.tipo()]
+        else:
+            price = self.base_price
+
+        if self.guisos_label is not None:
+            price += max(0, self.guisos - 1) * self.esquema.get("precio_guiso", 0)
+        return price
+
+    def update_price(self):
+        if self.type_box is not None and self.tipo() not in self.opciones:
+            self.price_label.setText("")
+            return
+
+        if self.esquema.get("precio_total"):
+            self.price_label.setText(f"Precio: ${self.unit_price() * self.qty}")
+        else:
+            self.price_label.setText(f"Precio unitario: ${self.unit_price()}")
+
+    # =========================
+    # CONFIRMAR
+    # =========================
+    def confirm(self):
+        if self.type_box is not None and self.tipo() not in self.opciones:
+            return
+
+        data = {
+            "categoria": self.categoria,
+            "tipo": self.tipo(),
+            "qty": self.qty,
+            "price": self.unit_price()
+        }
+
+        if self.guisos_label is not None:
+            data["tipo"] = f"{self.tipo()} ({self.guisos} guisos)"
+            data["guisos"] = self.guisos
+
+        if self.edit_data:
+            self.parent.ticket.replace_item(self.edit_row, data)
+        else:
+            self.parent.add_product(data)
+
+        self.accept()
@@ -0,0 +1,213 @@
+"""
+Cola de impresión persistente
+Los diálogos solo encolan el trabajo y siguen; un hilo dedicado lo
+imprime, juntando en una sola sesión de impresora los tickets que
+llegan seguidos. Si la impresora está apagada el trabajo se queda
+guardado en el almacén y se reintenta con espera creciente; los
+reintentos se imprimen uno por uno. Un trabajo con datos dañados, o que
+agotó sus intentos, se aparta y la ventana principal lo avisa.
+"""
+import threading
+import time
+from datetime import datetime
+
+import almacen
+from monitor_impresora import MONITOR
+
+# Espera entre reintentos: 2, 4, 8... segundos, hasta 5 minutos
+ESPERA_BASE = 2
+ESPERA_MAX = 300
+
+# Intentos antes de apartar un trabajo (unos 13 minutos de reintentos)
+MAX_INTENTOS = 10
+
+# Si ya hay más de un ticket esperando, se da este tiempo a que lleguen
+# los que se están cobrando y salen todos con la misma conexión
+VENTANA_LOTE = 0.4
+MAX_LOTE = 10
+
+
+class ColaImpresion:
+    """Hilo único que vacía la cola de impresión"""
+
+    def __init__(self):
+        self._despertar = threading.Event()
+        self._hilo = None
+        self._lock = threading.Lock()
+        self._apartadas = 0
+
+    def iniciar(self):
+        """Arranca el hilo (también imprime lo que quedó de la sesión anterior)"""
+        with self._lock:
+            if self._hilo is None:
+                self._hilo = threading.Thread(
+                    target=self._run, name="ColaImpresion", daemon=True
+                )
+                self._hilo.start()
+
+    def encolar(self, tipo, datos):
+        """Guarda el trabajo en disco y regresa de inmediato"""
+        almacen.encolar_impresion(tipo, datos, time.time())
+        self.iniciar()
+        self._despertar.set()
+
+    def apartadas(self):
+        """Trabajos que ya no se van a imprimir solos (para avisar en la interfaz)"""
+        return self._apartadas
+
+    # =========================
+    # HILO
+    # =========================
+    def _run(self):
+        try:
+            self._apartadas = almacen.contar_apartadas()
+        except Exception as e:
+            print(f"Error leyendo cola de impresión: {e}")
+
+        while True:
+            try:
+                trabajo = almacen.siguiente_impresion()
+            except Exception as e:
+                print(f"Error leyendo cola de impresión: {e}")
+                self._esperar(ESPERA_BASE)
+                continue
+
+            if trabajo is None:
+                self._esperar(None)
+                continue
+
+            espera = trabajo["siguiente"] - time.time()
+            if espera > 0:
+                self._esperar(espera)
+                continue
+
+            try:
+                self._procesar(self._lote(trabajo))
+            except Exception as e:
+                # Base ocupada al borrar o reprogramar: se vuelve a leer
+                print(f"Error en cola de impresión: {e}")
+                self._esperar(ESPERA_BASE)
+
+    def _lote(self, trabajo):
+        """
+        Trabajos a imprimir junto con el siguiente. Un reintento sale
+        solo (así un lote que falló no se vuelve a juntar igual), y un
+        ticket sin nada más en la cola sale sin esperar.
+        """
+        if trabajo["intentos"]:
+            return [trabajo]
+        try:
+            if len(almacen.impresiones_listas(time.time(), 2)) < 2:
+                return [trabajo]
+
+            # Dar un momento a que lleguen los tickets cobrados en seguida
+            time.sleep(VENTANA_LOTE)
+            return almacen.impresiones_listas(time.time(), MAX_LOTE) or [trabajo]
+        except Exception as e:
+            print(f"Error leyendo cola de impresión: {e}")
+            return [trabajo]
+
+    def _esperar(self, segundos):
+        self._despertar.wait(segundos)
+        self._despertar.clear()
+
+    def _apartar(self, trabajo, intentos, motivo):
+        print(f"Trabajo de impresión {trabajo['id']} apartado: {motivo}")
+        almacen.apartar_impresion(trabajo["id"], intentos, motivo, time.time())
+        self._apartadas += 1
+
+    def _procesar(self, lote):
+        # Un trabajo con datos dañados se aparta sin tumbar al resto
+        validos = []
+        for trabajo in lote:
+            try:
+                _recibo(trabajo)
+            except Exception as e:
+                self._apartar(trabajo, trabajo["intentos"], f"Datos inválidos: {e}")
+                continue
+            validos.append(trabajo)
+        lote = validos
+        if not lote:
+            return
+
+        impresos = []
+        try:
+            listo = imprimir_lote(lote, impresos.append)
+        except Exception as e:
+            print(f"Error imprimiendo: {e}")
+            listo = False
+
+        if listo:
+            almacen.borrar_impresion(*(t["id"] for t in lote))
+            return
+
+        # Los que alcanzaron a salir antes del error no se reimprimen
+        if impresos:
+            almacen.borrar_impresion(*impresos)
+
+        # Que el indicador de la impresora se entere ya, no en la próxima vuelta
+        MONITOR.revisar()
+
+        for trabajo in lote:
+            if trabajo["id"] in impresos:
+                continue
+            intentos = trabajo["intentos"] + 1
+            if intentos >= MAX_INTENTOS:
+                self._apartar(trabajo, intentos, "La impresora no respondió")
+                continue
+            espera = min(ESPERA_BASE ** intentos, ESPERA_MAX)
+            almacen.reprogramar_impresion(trabajo["id"], intentos, time.time() + espera)
+
+
+def _recibo(trabajo):
+    """(plantilla, datos) de un trabajo de la cola, o None si el tipo no existe"""
+    tipo, datos = trabajo["tipo"], dict(trabajo["datos"])
+    if tipo not in ("ticket", "corte"):
+        return None
+    datos["fecha"] = datetime.fromisoformat(datos["fecha"])
+    return tipo, datos
+
+
+def imprimir_lote(lote, impreso=None):
+    """
+    Imprime varios trabajos en una sola sesión de impresora. Devuelve
+    True si ya no hay que reintentarlos: impresos, o sin impresora
+    configurada / sin módulo (como antes, no se imprime). Si falla a
+    medias, impreso(id) ya se llamó con cada trabajo que sí salió.
+    """
+    try:
+        from impresora import SESION
+    except ImportError:
+        return True
+
+    # Tipos desconocidos se descartan
+    pares = [(t["id"], r) for t, r in zip(lote, map(_recibo, lote)) if r is not None]
+    if not pares:
+        return True
+
+    recibos = [r for _, r in pares]
+    avisar = (lambda i: impreso(pares[i][0])) if impreso else None
+    resultado = SESION.usar(lambda pm: pm.imprimir_lote(recibos, avisar))
+    return True if resultado is None else bool(resultado)
+
+
+COLA = ColaImpresion()
+
+
+def imprimir_ticket(ticket, ticket_num=None):
+    """Encola un modelo_ticket.Ticket"""
+    COLA.encolar("ticket", {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "items": ticket.to_dicts(),
+        "total": ticket.total,
+        "ticket_num": ticket_num
+    })
+
+
+def imprimir_corte(corte):
+    """Encola un modelo_ticket.Corte"""
+    COLA.encolar("corte", {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "total_vendido": corte.total_vendido,
+        "tickets_pagados": corte.tickets
+    })
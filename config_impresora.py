@@ -10,11 +10,12 @@ from PyQt5.QtWidgets import (
     QListWidget, QListWidgetItem
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from hilos import sin_esperar
 
 
 class DetectPrintersThread(QThread):
     """Hilo para detectar impresoras sin bloquear la UI"""
-    finished = pyqtSignal(list)
+    detectadas = pyqtSignal(list)
     error = pyqtSignal(str)
 
     def __init__(self, printer_manager):
@@ -24,11 +25,20 @@ class DetectPrintersThread(QThread):
     def run(self):
         try:
             printers = self.printer_manager.get_all_printers()
-            self.finished.emit(printers)
+            self.detectadas.emit(printers)
         except Exception as e:
             self.error.emit(str(e))
 
 
+class TestPrintThread(QThread):
+    """Impresión de prueba con la sesión compartida, sin bloquear la UI"""
+    resultado = pyqtSignal(object)
+
+    def run(self):
+        from impresora import SESION
+        self.resultado.emit(SESION.usar(lambda pm: pm.print_test()))
+
+
 class PrinterConfigDialog(QDialog):
     """Diálogo para configurar la impresora térmica"""
 
@@ -48,9 +58,18 @@ class PrinterConfigDialog(QDialog):
         self.setWindowTitle("Configurar Impresora")
         self.setFixedSize(550, 500)
 
+        self.detect_thread = None
+        self.test_thread = None
+
         self.setup_ui()
         self.load_current_config()
 
+        # Lo último detectado se muestra de inmediato y se refresca atrás
+        if self.printer_manager:
+            from descubrir_impresoras import DESCUBRIMIENTO
+            self.mostrar_impresoras(DESCUBRIMIENTO.en_cache())
+            self.detect_printers()
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -336,64 +355,86 @@ class PrinterConfigDialog(QDialog):
         return widget
 
     def detect_printers(self):
-        """Detecta impresoras USB"""
+        """Detecta impresoras USB y de Windows en segundo plano"""
         if not self.printer_manager:
             return
+        if self.detect_thread is not None and self.detect_thread.isRunning():
+            return
 
         self.btn_detect.setEnabled(False)
         self.btn_detect.setText("Detectando...")
-        self.printer_list.clear()
+        self.btn_detect_win.setEnabled(False)
 
         self.detect_thread = DetectPrintersThread(self.printer_manager)
-        self.detect_thread.finished.connect(self.on_printers_detected)
+        self.detect_thread.detectadas.connect(self.on_printers_detected)
         self.detect_thread.error.connect(self.on_detection_error)
-        self.detect_thread.start()
+        sin_esperar(self.detect_thread)
 
-    def on_printers_detected(self, printers):
-        """Callback cuando se detectan impresoras"""
+    def _fin_deteccion(self):
         self.btn_detect.setEnabled(True)
         self.btn_detect.setText("Detectar Impresoras USB")
+        self.btn_detect_win.setEnabled(True)
 
-        self.detected_printers = [p for p in printers if p["type"] == "usb"]
+    def on_printers_detected(self, printers):
+        """Callback cuando se detectan impresoras"""
+        self._fin_deteccion()
+        self.mostrar_impresoras(printers)
 
         if not self.detected_printers:
-            self.printer_list.addItem("No se detectaron impresoras USB")
             self.status_label.setText("Conecta tu impresora y vuelve a intentar")
-            return
-
-        for printer in self.detected_printers:
-            item = QListWidgetItem(f"{printer['name']}\nID: {printer['id']}")
-            item.setData(Qt.UserRole, printer)
-            self.printer_list.addItem(item)
-
-        self.status_label.setText(f"Se detectaron {len(self.detected_printers)} impresora(s)")
+        else:
+            self.status_label.setText(f"Se detectaron {len(self.detected_printers)} impresora(s)")
 
     def on_detection_error(self, error):
         """Callback en caso de error"""
-        self.btn_detect.setEnabled(True)
-        self.btn_detect.setText("Detectar Impresoras USB")
+        self._fin_deteccion()
         self.status_label.setText(f"Error: {error}")
 
-    def detect_windows_printers(self):
-        """Detecta impresoras de Windows"""
-        if not self.printer_manager:
-            return
-
-        self.windows_printer_list.clear()
-
-        printers = self.printer_manager.detect_windows_printers()
+    def _llenar_lista(self, lista, printers, texto, vacia):
+        """Rellena una lista conservando la impresora seleccionada"""
+        actual = lista.currentItem()
+        seleccion = actual.data(Qt.UserRole) if actual else None
+        seleccion = seleccion["id"] if seleccion else None
 
+        lista.clear()
         if not printers:
-            self.windows_printer_list.addItem("No se detectaron impresoras")
-            self.status_label.setText("Instala una impresora en Windows primero")
+            lista.addItem(vacia)
             return
 
         for printer in printers:
-            item = QListWidgetItem(f"{printer['name']}")
+            item = QListWidgetItem(texto(printer))
             item.setData(Qt.UserRole, printer)
-            self.windows_printer_list.addItem(item)
+            lista.addItem(item)
+            if printer["id"] == seleccion:
+                lista.setCurrentItem(item)
+
+    def mostrar_impresoras(self, printers):
+        """Muestra una lista de impresoras (del caché o de una detección)"""
+        self.detected_printers = [p for p in printers if p["type"] == "usb"]
+        windows = [p for p in printers if p["type"] == "windows"]
 
-        self.status_label.setText(f"Se detectaron {len(printers)} impresora(s)")
+        self._llenar_lista(
+            self.printer_list, self.detected_printers,
+            lambda p: f"{p['name']}\nID: {p['id']}",
+            "No se detectaron impresoras USB"
+        )
+        self._llenar_lista(
+            self.windows_printer_list, windows,
+            lambda p: p["name"],
+            "No se detectaron impresoras"
+        )
+
+    def detect_windows_printers(self):
+        """Detecta impresoras de Windows"""
+        self.detect_printers()
+
+    def done(self, resultado):
+        # La detección puede seguir (leer descriptores USB tarda); al
+        # terminar deja su resultado en el caché de DESCUBRIMIENTO.
+        # Este PrinterManager solo guarda la configuración; imprime SESION
+        if self.printer_manager:
+            self.printer_manager.disconnect()
+        super().done(resultado)
 
     def load_current_config(self):
         """Carga la configuración actual"""
@@ -497,28 +538,41 @@ class PrinterConfigDialog(QDialog):
             )
             return
 
-        try:
-            self.printer_manager.save_config(config)
+        if self.test_thread is not None and self.test_thread.isRunning():
+            return
 
-            if not self.printer_manager.connect_from_config():
-                raise Exception("No se pudo conectar a la impresora")
+        # La prueba usa la sesión compartida (la misma conexión que los
+        # tickets), así que primero se guarda la impresora elegida
+        self.printer_manager.save_config(config)
 
-            if self.printer_manager.print_test():
-                QMessageBox.information(
-                    self,
-                    "Prueba",
-                    "Impresión de prueba enviada correctamente"
-                )
-            else:
-                raise Exception("Error al enviar impresión")
+        self.btn_test.setEnabled(False)
+        self.btn_test.setText("Imprimiendo...")
 
-        except Exception as e:
-            QMessageBox.critical(
+        self.test_thread = TestPrintThread()
+        self.test_thread.resultado.connect(self.on_test_printed)
+        sin_esperar(self.test_thread)
+
+    def on_test_printed(self, resultado):
+        """Callback de la impresión de prueba"""
+        self.btn_test.setEnabled(True)
+        self.btn_test.setText("Probar Impresión")
+
+        if resultado:
+            QMessageBox.information(
                 self,
-                "Error",
-                f"Error al imprimir:\n{str(e)}\n\n"
-                "Verifica que la impresora esté conectada y encendida."
+                "Prueba",
+                "Impresión de prueba enviada correctamente"
             )
+            return
+
+        error = ("Falta python-escpos para esta impresora" if resultado is None
+                 else "No se pudo conectar o enviar la impresión")
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error al imprimir:\n{error}\n\n"
+            "Verifica que la impresora esté conectada y encendida."
+        )
 
     def save_config(self):
         """Guarda la configuración"""
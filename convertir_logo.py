@@ -1,4 +1,5 @@
 from PIL import Image
+from logo_raster import generar_cache
 
 img = Image.open("logo.png")
 
@@ -16,4 +17,7 @@ img = img.point(lambda x: 0 if x < 128 else 255, '1')
 # Guardar imagen lista para ESC/POS
 img.save("logo_escpos.png")
 
-print("Logo convertido correctamente → logo_escpos.png")
+# Precalcular los bytes ESC/POS que se envían en cada ticket
+generar_cache()
+
+print("Logo convertido correctamente → logo_escpos.png + logo_escpos.bin")
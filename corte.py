@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import (
 )
 from datetime import datetime
 from guardar_corte import guardar_corte
+from cola_impresion import imprimir_corte
+from plantillas_recibo import a_vista
 
 
 class CorteDialog(QDialog):
@@ -95,14 +97,10 @@ class CorteDialog(QDialog):
                 self.print_corte()
 
             # Guardar corte
-            guardar_corte(
-                self.ticket.total_vendido,
-                self.ticket.tickets_pagados
-            )
+            guardar_corte(self.ticket.corte)
 
             # Reiniciar contadores del día
-            self.ticket.total_vendido = 0.0
-            self.ticket.tickets_pagados = 0
+            self.ticket.corte.reiniciar()
 
             QMessageBox.information(
                 self,
@@ -120,45 +118,13 @@ class CorteDialog(QDialog):
             )
 
     def print_corte(self):
-        """Imprime el corte del día - NO falla si no hay impresora"""
-        try:
-            from impresora import PrinterManager
-
-            pm = PrinterManager()
-
-            # Si no hay configuración, simplemente no imprime
-            if not pm.config:
-                return
-
-            if pm.connect_from_config():
-                pm.print_corte(
-                    self.ticket.total_vendido,
-                    self.ticket.tickets_pagados
-                )
-
-        except ImportError:
-            pass
-        except Exception:
-            pass
+        """Encola el corte para imprimir - NO espera a la impresora"""
+        imprimir_corte(self.ticket.corte)
 
     def generate_ticket(self):
-        now = datetime.now()
-
-        return f"""
-╔══════════════════════════════╗
-║     MICHEL - CORTE DEL DÍA   ║
-╚══════════════════════════════╝
-
-  Fecha: {now.strftime('%d/%m/%Y')}
-  Hora:  {now.strftime('%H:%M:%S')}
-
-──────────────────────────────
-
-  Tickets cobrados: {self.ticket.tickets_pagados}
-  
-  Total vendido:    ${self.ticket.total_vendido:.2f}
-
-──────────────────────────────
-
-         FIN DEL CORTE
-""".strip()
\ No newline at end of file
+        # Misma plantilla que el corte impreso
+        return a_vista("corte", {
+            "fecha": datetime.now(),
+            "total_vendido": self.ticket.corte.total_vendido,
+            "tickets_pagados": self.ticket.corte.tickets
+        })
@@ -0,0 +1,166 @@
+"""
+Detección de impresoras con caché
+Leer los descriptores USB es lento (y a veces se vence el tiempo), así
+que cada dispositivo se clasifica una sola vez y se guarda por bus y
+dirección. Los escaneos siguientes solo revisan lo que se conectó o
+desconectó desde la vez anterior.
+"""
+import sys
+import threading
+
+# Fabricantes conocidos de impresoras térmicas
+VENDEDORES_IMPRESORA = frozenset({
+    0x04b8, 0x0519, 0x0dd4, 0x0fe6, 0x1504,
+    0x0416, 0x0483, 0x1fc9, 0x0525, 0x28e9,
+    0x6868, 0x0456, 0x067b, 0x1a86, 0x10c4
+})
+PALABRAS_IMPRESORA = ("printer", "pos", "receipt", "thermal", "escpos")
+CLASE_IMPRESORA = 7
+
+
+def _texto_usb(device, indice, default):
+    import usb.util
+
+    try:
+        return usb.util.get_string(device, indice) or default
+    except Exception:
+        return default
+
+
+def _es_clase_impresora(device):
+    if device.bDeviceClass == CLASE_IMPRESORA:
+        return True
+    try:
+        for cfg in device:
+            for intf in cfg:
+                if intf.bInterfaceClass == CLASE_IMPRESORA:
+                    return True
+    except Exception:
+        pass
+    return False
+
+
+def _clasificar_usb(device):
+    """Diccionario de la impresora, o None si el dispositivo no es impresora"""
+    vendor_id = device.idVendor
+    product_id = device.idProduct
+
+    # Primero lo barato: fabricante y clase, sin leer cadenas
+    es_impresora = vendor_id in VENDEDORES_IMPRESORA or _es_clase_impresora(device)
+
+    product = _texto_usb(device, device.iProduct, "Dispositivo USB")
+    if not es_impresora:
+        if not any(kw in product.lower() for kw in PALABRAS_IMPRESORA):
+            return None
+
+    manufacturer = _texto_usb(device, device.iManufacturer, "Desconocido")
+    return {
+        "type": "usb",
+        "vendor_id": vendor_id,
+        "product_id": product_id,
+        "manufacturer": manufacturer,
+        "product": product,
+        "name": f"{manufacturer} - {product}",
+        "id": f"0x{vendor_id:04x}:0x{product_id:04x}"
+    }
+
+
+class DescubrimientoImpresoras:
+    """Resultados de detección compartidos por todo el proceso"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._usb = {}       # (bus, dirección) -> ((vendor, product), impresora o None)
+        self._windows = []
+
+    # =========================
+    # CACHÉ
+    # =========================
+    def en_cache(self):
+        """Impresoras de la última detección, sin tocar el hardware"""
+        with self._lock:
+            usb = [imp for _, imp in self._usb.values() if imp is not None]
+            return usb + list(self._windows)
+
+    # =========================
+    # ESCANEO
+    # =========================
+    def escanear_usb(self):
+        """Escaneo incremental: solo se leen los dispositivos nuevos"""
+        try:
+            import usb.core
+        except ImportError:
+            return []
+
+        try:
+            devices = list(usb.core.find(find_all=True) or [])
+        except Exception:
+            devices = []
+
+        with self._lock:
+            anterior = dict(self._usb)
+
+        actual = {}
+        for device in devices:
+            try:
+                llave = (device.bus, device.address)
+                ids = (device.idVendor, device.idProduct)
+                conocido = anterior.get(llave)
+                if conocido is not None and conocido[0] == ids:
+                    actual[llave] = conocido
+                else:
+                    actual[llave] = (ids, _clasificar_usb(device))
+            except Exception:
+                continue
+
+        with self._lock:
+            self._usb = actual
+        return [imp for _, imp in actual.values() if imp is not None]
+
+    def escanear_windows(self):
+        """Impresoras locales y de red de Windows, enumeradas en paralelo"""
+        if sys.platform != "win32":
+            return []
+
+        try:
+            import win32print
+        except ImportError:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def enumerar(bandera):
+            try:
+                return win32print.EnumPrinters(bandera)
+            except Exception:
+                return []
+
+        banderas = (win32print.PRINTER_ENUM_LOCAL, win32print.PRINTER_ENUM_CONNECTIONS)
+        with ThreadPoolExecutor(max_workers=len(banderas)) as pool:
+            listas = list(pool.map(enumerar, banderas))
+
+        printers = []
+        vistos = set()
+        for lista in listas:
+            for printer in lista:
+                nombre = printer[2]
+                if nombre in vistos:
+                    continue
+                vistos.add(nombre)
+                printers.append({"type": "windows", "name": nombre, "id": nombre})
+
+        with self._lock:
+            self._windows = printers
+        return printers
+
+    def escanear(self):
+        """USB y Windows a la vez; devuelve la lista completa"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            usb = pool.submit(self.escanear_usb)
+            windows = pool.submit(self.escanear_windows)
+            return usb.result() + windows.result()
+
+
+DESCUBRIMIENTO = DescubrimientoImpresoras()
@@ -0,0 +1,135 @@
+"""
+Diagnóstico de arranque
+Mide cuánto tarda en importarse cada módulo al abrir la aplicación (al
+estilo de python -X importtime, pero funciona también en el .exe) y lo
+compara con el presupuesto de arranque.
+
+    python diagnostico.py
+    python main.py --diagnostico
+    Mi_Comalito_POS.exe --diagnostico
+
+El reporte se guarda en diagnostico_arranque.txt (junto al .exe, que no
+tiene consola) y además se imprime si hay consola.
+"""
+import builtins
+import importlib
+import sys
+import time
+from pathlib import Path
+
+CONGELADO = getattr(sys, "frozen", False)
+
+NOMBRE_ARCHIVO = "diagnostico_arranque.txt"
+ARCHIVO = (Path(sys.executable).parent if CONGELADO else Path(".")) / NOMBRE_ARCHIVO
+
+# Módulos que se importan antes de ver la ventana, en orden, y cuántos
+# milisegundos se les permite tardar a cada uno (sin contar lo ya cargado)
+PRESUPUESTO_MS = {
+    "main": 400,
+    "pos": 400,
+}
+
+# En el .exe main es el script de entrada y no se puede importar; se
+# mide lo que main.py importa, en el mismo orden
+IMPORTS_MAIN = ["PyQt5.QtCore", "PyQt5.QtGui", "PyQt5.QtWidgets", "imagenes", "tema"]
+
+# Filas del reporte
+MAX_FILAS = 30
+
+
+def medir(modulos):
+    """
+    Importa los módulos y regresa:
+    - [(módulo, ms acumulados)] de cada módulo pedido
+    - [(nombre, ms propios, ms acumulados, nivel)] de cada import nuevo
+    """
+    registros = []
+    pila = []
+    original = builtins.__import__
+
+    def importar(name, globals=None, locals=None, fromlist=(), level=0):
+        # Solo cuenta la primera vez que se carga un módulo
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        inicio = time.perf_counter()
+        pila.append(0.0)
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - inicio
+            hijos = pila.pop()
+            if pila:
+                pila[-1] += total
+            registros.append((name, (total - hijos) * 1000, total * 1000, len(pila)))
+
+    tiempos = []
+    builtins.__import__ = importar
+    try:
+        for modulo in modulos:
+            inicio = time.perf_counter()
+            importlib.import_module(modulo)
+            tiempos.append((modulo, (time.perf_counter() - inicio) * 1000))
+    finally:
+        builtins.__import__ = original
+
+    return tiempos, registros
+
+
+def reporte(tiempos, registros, max_filas=MAX_FILAS):
+    """Texto del reporte y si todo quedó dentro del presupuesto"""
+    lineas = ["DIAGNÓSTICO DE ARRANQUE", "=" * 60]
+    dentro = True
+
+    for modulo, ms in tiempos:
+        limite = PRESUPUESTO_MS.get(modulo)
+        if limite is None:
+            lineas.append(f"{modulo:<12} {ms:8.1f} ms")
+            continue
+        ok = ms <= limite
+        dentro = dentro and ok
+        marca = "OK" if ok else "EXCEDIDO"
+        lineas.append(f"{modulo:<12} {ms:8.1f} ms   (presupuesto {limite} ms) {marca}")
+
+    lineas += ["", f"Imports más lentos (de {len(registros)} módulos nuevos):",
+               f"{'propio ms':>10} | {'acumulado ms':>12} | módulo"]
+    for nombre, propio, acumulado, nivel in sorted(
+            registros, key=lambda r: r[2], reverse=True)[:max_filas]:
+        lineas.append(f"{propio:10.1f} | {acumulado:12.1f} | {'  ' * nivel}{nombre}")
+
+    return "\n".join(lineas), dentro
+
+
+def modulos():
+    """Módulos a medir, en el orden en que se cargan al arrancar"""
+    if CONGELADO:
+        return IMPORTS_MAIN + [m for m in PRESUPUESTO_MS if m != "main"]
+    return list(PRESUPUESTO_MS)
+
+
+def guardar(texto):
+    """Escribe el reporte; si la carpeta del .exe es de solo lectura, en la del usuario"""
+    for archivo in (ARCHIVO, Path.home() / NOMBRE_ARCHIVO):
+        try:
+            archivo.write_text(texto + "\n", encoding="utf-8")
+            return archivo
+        except OSError:
+            continue
+    return None
+
+
+def principal():
+    tiempos, registros = medir(modulos())
+    texto, dentro = reporte(tiempos, registros)
+
+    archivo = guardar(texto)
+    # El .exe no tiene consola (sys.stdout es None)
+    if sys.stdout is not None:
+        print(texto)
+        print(f"\nGuardado en {archivo}" if archivo else f"\nNo se pudo guardar {NOMBRE_ARCHIVO}")
+
+    return 0 if dentro else 1
+
+
+if __name__ == "__main__":
+    sys.exit(principal())
@@ -0,0 +1,85 @@
+"""
+Diálogos de categoría reutilizables
+Cada diálogo se construye una sola vez (al primer uso o en ratos libres
+después del login) y se reutiliza: al abrirlo solo se reinicia su
+estado con preparar(edit_data, edit_row).
+"""
+import importlib
+
+from PyQt5.QtCore import QTimer
+
+# Diálogos con interfaz propia: nombre -> (módulo, clase).
+# Los demás productos salen de categorias.producto.ESQUEMAS.
+DIALOGOS = {
+    "bebidas": ("categorias.bebidas", "BebidasDialog"),
+    "postres": ("categorias.postres", "PostresDialog"),
+}
+
+# Categoría guardada en el ticket -> diálogo con que se edita
+POR_CATEGORIA = {
+    "Bebidas": "bebidas",
+    "Postres": "postres",
+}
+
+# Milisegundos entre un diálogo y otro al precalentar
+PAUSA_PRECALENTAR = 50
+
+
+def _esquemas():
+    from categorias.producto import ESQUEMAS
+    return ESQUEMAS
+
+
+def dialogo_de_categoria(categoria):
+    """Nombre del diálogo que edita un producto del ticket (o None)"""
+    if categoria in POR_CATEGORIA:
+        return POR_CATEGORIA[categoria]
+    for nombre, esquema in _esquemas().items():
+        if esquema["categoria"] == categoria:
+            return nombre
+    return None
+
+
+def _crear(nombre, parent):
+    if nombre in DIALOGOS:
+        modulo, clase = DIALOGOS[nombre]
+        return getattr(importlib.import_module(modulo), clase)(parent)
+
+    from categorias.producto import ProductoDialog
+    return ProductoDialog(parent, _esquemas()[nombre])
+
+
+class PoolDialogos:
+    """Una instancia de cada diálogo de categoría, creada bajo demanda"""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self._dialogos = {}
+
+    def obtener(self, nombre):
+        dialogo = self._dialogos.get(nombre)
+        if dialogo is None:
+            dialogo = self._dialogos[nombre] = _crear(nombre, self.parent)
+        return dialogo
+
+    def abrir(self, nombre, edit_data=None, edit_row=None):
+        """Reinicia el diálogo y lo muestra (modal)"""
+        dialogo = self.obtener(nombre)
+        dialogo.preparar(edit_data, edit_row)
+        return dialogo.exec_()
+
+    def precalentar(self, nombres=None):
+        """Construye los diálogos que falten, uno por vuelta del event loop"""
+        nombres = nombres or list(_esquemas()) + list(DIALOGOS)
+        pendientes = [n for n in nombres if n not in self._dialogos]
+
+        def siguiente():
+            if not pendientes:
+                return
+            try:
+                self.obtener(pendientes.pop(0))
+            except Exception as e:
+                print(f"Error precargando diálogo: {e}")
+            QTimer.singleShot(PAUSA_PRECALENTAR, siguiente)
+
+        QTimer.singleShot(PAUSA_PRECALENTAR, siguiente)
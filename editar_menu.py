@@ -1,28 +1,10 @@
-import json
-from pathlib import Path
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout,
     QPushButton, QTableWidget, QTableWidgetItem,
     QMessageBox, QLineEdit, QLabel
 )
 from PyQt5.QtCore import Qt
-
-ARCH_GUISOS = Path("guisos.json")
-ARCH_AGUAS = Path("aguas.json")
-ARCH_REFRESCOS = Path("refrescos.json")
-ARCH_POSTRES = Path("postres.json")
-
-
-def cargar_json(path):
-    if not path.exists():
-        return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def guardar_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+from catalogo import CATALOGO
 
 
 class EditarMenuDialog(QDialog):
@@ -34,10 +16,10 @@ class EditarMenuDialog(QDialog):
 
         self.seccion_actual = "guisos"
 
-        self.guisos = cargar_json(ARCH_GUISOS)
-        self.aguas = cargar_json(ARCH_AGUAS)
-        self.refrescos = cargar_json(ARCH_REFRESCOS)
-        self.postres = cargar_json(ARCH_POSTRES)
+        self.guisos = dict(CATALOGO.obtener("guisos"))
+        self.aguas = dict(CATALOGO.obtener("aguas"))
+        self.refrescos = dict(CATALOGO.obtener("refrescos"))
+        self.postres = dict(CATALOGO.obtener("postres"))
 
         layout = QVBoxLayout(self)
 
@@ -212,15 +194,15 @@ class EditarMenuDialog(QDialog):
 
         if self.seccion_actual == "guisos":
             self.guisos = data
-            guardar_json(ARCH_GUISOS, data)
+            CATALOGO.guardar("guisos", data)
         elif self.seccion_actual == "aguas":
             self.aguas = data
-            guardar_json(ARCH_AGUAS, data)
+            CATALOGO.guardar("aguas", data)
         elif self.seccion_actual == "refrescos":
             self.refrescos = data
-            guardar_json(ARCH_REFRESCOS, data)
+            CATALOGO.guardar("refrescos", data)
         else:
             self.postres = data
-            guardar_json(ARCH_POSTRES, data)
+            CATALOGO.guardar("postres", data)
 
         QMessageBox.information(self, "Listo", "Cambios guardados correctamente")
@@ -1,25 +1,18 @@
-import json
 from datetime import datetime
-from pathlib import Path
 
-ARCHIVO = Path("ventas.json")
+import almacen
 
 
-def guardar_corte(total_vendido, tickets_pagados):
-    corte = {
+def guardar_corte(corte):
+    """Guarda un modelo_ticket.Corte"""
+    almacen.agregar_corte({
         "fecha": datetime.now().strftime("%Y-%m-%d"),
         "hora": datetime.now().strftime("%H:%M:%S"),
-        "total_vendido": total_vendido,
-        "tickets_pagados": tickets_pagados
-    }
+        "total_vendido": corte.total_vendido,
+        "tickets_pagados": corte.tickets
+    })
 
-    if ARCHIVO.exists():
-        with open(ARCHIVO, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    else:
-        data = []
 
-    data.append(corte)
-
-    with open(ARCHIVO, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+def leer_cortes(desde=None, hasta=None):
+    """Devuelve los cortes guardados, del más antiguo al más nuevo"""
+    return almacen.listar_cortes(desde, hasta)
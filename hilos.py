@@ -0,0 +1,14 @@
+"""
+Hilos de fondo de los diálogos
+Destruir un QThread que sigue corriendo tumba la aplicación, y esperarlo
+al cerrar congela la interfaz. Los hilos se guardan aquí hasta que
+terminan, así un diálogo se puede cerrar en cualquier momento.
+"""
+_HILOS = set()
+
+
+def sin_esperar(hilo):
+    """Arranca el hilo sin atarlo a quien lo creó: cerrar nunca lo espera"""
+    _HILOS.add(hilo)
+    hilo.finished.connect(lambda: _HILOS.discard(hilo))
+    hilo.start()
@@ -0,0 +1,135 @@
+"""
+Caché de imágenes de la interfaz
+Cada archivo se decodifica una sola vez por proceso; el login puede
+precargar las imágenes de la ventana principal mientras espera.
+
+Las versiones escaladas se guardan en un LRU por (archivo, tamaño,
+modo). El escalado suave de imágenes grandes se hace en un hilo con
+QImage (QPixmap solo puede usarse en el hilo de la interfaz) y el
+resultado se entrega de vuelta por una señal.
+"""
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+# Versiones escaladas que se conservan (tamaños de ventana recientes)
+MAX_ESCALADAS = 8
+
+_lock = threading.Lock()
+_imagenes = {}
+_pixmaps = {}
+_escaladas = OrderedDict()   # (ruta, ancho, alto, modo) -> QPixmap
+_pendientes = {}             # misma llave -> [callbacks]
+
+
+# =========================
+# ORIGINALES
+# =========================
+def imagen(ruta):
+    """QImage del archivo (se puede leer desde cualquier hilo)"""
+    with _lock:
+        original = _imagenes.get(ruta)
+        if original is None:
+            original = _imagenes[ruta] = QImage(ruta)
+        return original
+
+
+def pixmap(ruta):
+    """QPixmap del archivo (decodificado solo la primera vez)"""
+    original = _pixmaps.get(ruta)
+    if original is None:
+        original = _pixmaps[ruta] = QPixmap.fromImage(imagen(ruta))
+    return original
+
+
+def precargar(*rutas):
+    for ruta in rutas:
+        pixmap(ruta)
+
+
+# =========================
+# ESCALADAS (LRU)
+# =========================
+def _llave(ruta, tamaño, modo):
+    return (ruta, tamaño.width(), tamaño.height(), int(modo))
+
+
+def en_cache(ruta, tamaño, modo=Qt.KeepAspectRatioByExpanding):
+    """Versión escalada ya calculada, o None"""
+    llave = _llave(ruta, tamaño, modo)
+    escalada = _escaladas.get(llave)
+    if escalada is not None:
+        _escaladas.move_to_end(llave)
+    return escalada
+
+
+def _guardar(llave, escalada):
+    _escaladas[llave] = escalada
+    _escaladas.move_to_end(llave)
+    while len(_escaladas) > MAX_ESCALADAS:
+        _escaladas.popitem(last=False)
+
+
+def escalar(ruta, tamaño, modo=Qt.KeepAspectRatioByExpanding):
+    """Escalado suave en el hilo actual (para tamaños fijos y chicos)"""
+    escalada = en_cache(ruta, tamaño, modo)
+    if escalada is None:
+        escalada = pixmap(ruta).scaled(tamaño, modo, Qt.SmoothTransformation)
+        _guardar(_llave(ruta, tamaño, modo), escalada)
+    return escalada
+
+
+def vista_previa(ruta, tamaño, modo=Qt.KeepAspectRatioByExpanding):
+    """Escalado rápido (sin suavizar) para mostrar mientras llega el bueno"""
+    return pixmap(ruta).scaled(tamaño, modo, Qt.FastTransformation)
+
+
+# =========================
+# ESCALADO EN SEGUNDO PLANO
+# =========================
+class _Entrega(QObject):
+    """Vive en el hilo de la interfaz; recibe las imágenes ya escaladas"""
+    lista = pyqtSignal(object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.lista.connect(self._recibir)
+
+    def _recibir(self, llave, escalada):
+        resultado = QPixmap.fromImage(escalada)
+        _guardar(llave, resultado)
+        for listo in _pendientes.pop(llave, []):
+            listo(resultado)
+
+
+_entrega = None
+
+
+def escalar_en_fondo(ruta, tamaño, listo, modo=Qt.KeepAspectRatioByExpanding):
+    """
+    Pide la versión suave; listo(pixmap) se llama en el hilo de la
+    interfaz. Si ya está en caché se llama de inmediato.
+    """
+    global _entrega
+
+    escalada = en_cache(ruta, tamaño, modo)
+    if escalada is not None:
+        listo(escalada)
+        return
+
+    llave = _llave(ruta, tamaño, modo)
+    if llave in _pendientes:
+        _pendientes[llave].append(listo)
+        return
+    _pendientes[llave] = [listo]
+
+    if _entrega is None:
+        _entrega = _Entrega()
+    tamaño = QSize(tamaño)
+
+    def trabajar():
+        _entrega.lista.emit(llave, imagen(ruta).scaled(tamaño, modo, Qt.SmoothTransformation))
+
+    threading.Thread(target=trabajar, name="EscalarImagen", daemon=True).start()
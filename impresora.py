@@ -2,13 +2,23 @@
 Módulo de impresión para tickets térmicos ESC/POS
 Soporta impresoras USB, de red y Windows
 Si no hay impresora, no genera errores
+escpos y PIL se importan hasta que se conecta o se imprime el logo.
 """
-from escpos.printer import Usb
-import os
-import sys
+import importlib.util
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-import tempfile
-from PIL import Image, ImageDraw, ImageFont
+from descubrir_impresoras import DESCUBRIMIENTO
+from logo_raster import cargar_logo
+from recibo_escpos import enviar
+from plantillas_recibo import a_escpos, a_texto
+
+# Segundos máximos esperando la respuesta a una consulta de estado
+TIMEOUT_ESTADO = 1.5
+
+# Impresoras (o versiones de python-escpos) que no contestan DLE EOT
+ESTADO_DESCONOCIDO = {"estado": "desconocido", "detalle": "Estado no disponible"}
 
 
 class PrinterManager:
@@ -21,15 +31,10 @@ class PrinterManager:
         self.config = self.load_config()
 
     def load_config(self):
-        """Carga configuración de impresora desde archivo"""
+        """Carga configuración de impresora desde el almacén"""
         try:
-            import json
-            from pathlib import Path
-
-            config_file = Path("printer_config.json")
-            if config_file.exists():
-                with open(config_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+            import almacen
+            return almacen.cargar_config("impresora", {})
         except:
             pass
         return {}
@@ -37,129 +42,27 @@ class PrinterManager:
     def save_config(self, config):
         """Guarda configuración de impresora"""
         try:
-            import json
+            import almacen
 
-            with open("printer_config.json", "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4)
+            almacen.guardar_config("impresora", config)
             self.config = config
+
+            # La sesión compartida debe reconectar con la nueva impresora
+            SESION.invalidar()
         except Exception as e:
             print(f"Error guardando config: {e}")
 
     def detect_usb_printers(self):
-        """Detecta impresoras USB conectadas"""
-        printers = []
-
-        try:
-            import usb.core
-            import usb.util
-
-            devices = usb.core.find(find_all=True)
-            if devices is None:
-                return printers
-
-            for device in devices:
-                try:
-                    vendor_id = device.idVendor
-                    product_id = device.idProduct
-
-                    try:
-                        manufacturer = usb.util.get_string(device, device.iManufacturer) or "Desconocido"
-                    except:
-                        manufacturer = "Desconocido"
-
-                    try:
-                        product = usb.util.get_string(device, device.iProduct) or "Dispositivo USB"
-                    except:
-                        product = "Dispositivo USB"
-
-                    is_printer = False
-
-                    if device.bDeviceClass == 7:
-                        is_printer = True
-
-                    try:
-                        for cfg in device:
-                            for intf in cfg:
-                                if intf.bInterfaceClass == 7:
-                                    is_printer = True
-                                    break
-                    except:
-                        pass
-
-                    known_printer_vendors = [
-                        0x04b8, 0x0519, 0x0dd4, 0x0fe6, 0x1504,
-                        0x0416, 0x0483, 0x1fc9, 0x0525, 0x28e9,
-                        0x6868, 0x0456, 0x067b, 0x1a86, 0x10c4
-                    ]
-
-                    if vendor_id in known_printer_vendors:
-                        is_printer = True
-
-                    product_lower = product.lower() if product else ""
-                    if any(kw in product_lower for kw in ['printer', 'pos', 'receipt', 'thermal', 'escpos']):
-                        is_printer = True
-
-                    if is_printer:
-                        printers.append({
-                            "type": "usb",
-                            "vendor_id": vendor_id,
-                            "product_id": product_id,
-                            "manufacturer": manufacturer,
-                            "product": product,
-                            "name": f"{manufacturer} - {product}",
-                            "id": f"0x{vendor_id:04x}:0x{product_id:04x}"
-                        })
-
-                except:
-                    continue
-
-        except ImportError:
-            pass
-        except:
-            pass
-
-        return printers
+        """Detecta impresoras USB conectadas (ver descubrir_impresoras.py)"""
+        return DESCUBRIMIENTO.escanear_usb()
 
     def detect_windows_printers(self):
         """Detecta impresoras instaladas en Windows"""
-        printers = []
-
-        if sys.platform != 'win32':
-            return printers
-
-        try:
-            import win32print
-
-            printer_list = win32print.EnumPrinters(
-                win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
-            )
-
-            for printer in printer_list:
-                printers.append({
-                    "type": "windows",
-                    "name": printer[2],
-                    "id": printer[2]
-                })
-
-        except ImportError:
-            pass
-        except:
-            pass
-
-        return printers
+        return DESCUBRIMIENTO.escanear_windows()
 
     def get_all_printers(self):
         """Obtiene todas las impresoras disponibles"""
-        all_printers = []
-
-        usb_printers = self.detect_usb_printers()
-        all_printers.extend(usb_printers)
-
-        if sys.platform == 'win32':
-            win_printers = self.detect_windows_printers()
-            all_printers.extend(win_printers)
-
-        return all_printers
+        return DESCUBRIMIENTO.escanear()
 
     def connect_usb(self, vendor_id, product_id):
         """Conecta a una impresora USB"""
@@ -222,6 +125,93 @@ class PrinterManager:
         """Verifica si hay una impresora conectada"""
         return self.printer is not None
 
+    def disconnect(self):
+        """Cierra la conexión USB / de red"""
+        try:
+            if hasattr(self.printer, "close"):
+                self.printer.close()
+        except:
+            pass
+        self.printer = None
+
+    @contextmanager
+    def lectura_corta(self):
+        """Limita cuánto se espera la respuesta de la impresora (USB y Red)"""
+        device = getattr(self.printer, "device", None)
+        anterior = None
+        try:
+            if self.printer_type == "network" and device is not None:
+                anterior = device.gettimeout()
+                device.settimeout(TIMEOUT_ESTADO)
+            elif self.printer_type == "usb" and device is not None:
+                anterior = device.default_timeout
+                device.default_timeout = int(TIMEOUT_ESTADO * 1000)
+        except Exception:
+            device = None
+
+        try:
+            yield
+        finally:
+            try:
+                if device is not None and self.printer_type == "network":
+                    device.settimeout(anterior)
+                elif device is not None and self.printer_type == "usb":
+                    device.default_timeout = anterior
+            except Exception:
+                pass
+
+    def consultar_estado(self):
+        """
+        Estado de la impresora conectada: {"estado": ..., "detalle": ...}.
+        USB y Red preguntan con DLE EOT; Windows lee el estado del spooler.
+        Nunca lanza: si la impresora no sabe o no alcanza a contestar, el
+        estado es "desconocido" (no quiere decir que esté desconectada).
+        """
+        if not self.printer:
+            return {"estado": "desconectada", "detalle": "Sin conexión"}
+
+        try:
+            if self.printer_type == "windows":
+                return self._estado_windows()
+
+            # python-escpos >= 3 (DLE EOT 1 y DLE EOT 4)
+            if not hasattr(self.printer, "is_online"):
+                return ESTADO_DESCONOCIDO
+            with self.lectura_corta():
+                if not self.printer.is_online():
+                    return {"estado": "desconectada", "detalle": "Fuera de línea"}
+                papel = None
+                if hasattr(self.printer, "paper_status"):
+                    papel = self.printer.paper_status()
+        except Exception as e:
+            print(f"Estado de impresora no disponible: {e}")
+            return ESTADO_DESCONOCIDO
+
+        if papel == 0:
+            return {"estado": "sin_papel", "detalle": "Sin papel"}
+        if papel == 1:
+            return {"estado": "poco_papel", "detalle": "Queda poco papel"}
+        return {"estado": "lista", "detalle": "Lista"}
+
+    def _estado_windows(self):
+        import win32print
+
+        hprinter = win32print.OpenPrinter(self.printer_name)
+        try:
+            info = win32print.GetPrinter(hprinter, 2)
+        finally:
+            win32print.ClosePrinter(hprinter)
+
+        status = info["Status"]
+        if (status & win32print.PRINTER_STATUS_OFFLINE
+                or info["Attributes"] & win32print.PRINTER_ATTRIBUTE_WORK_OFFLINE):
+            return {"estado": "desconectada", "detalle": "Fuera de línea"}
+        if status & win32print.PRINTER_STATUS_PAPER_OUT:
+            return {"estado": "sin_papel", "detalle": "Sin papel"}
+        if status & (win32print.PRINTER_STATUS_ERROR | win32print.PRINTER_STATUS_PAPER_JAM):
+            return {"estado": "error", "detalle": "Error en la impresora"}
+        return {"estado": "lista", "detalle": "Lista"}
+
     def _print_windows_raw(self, text):
         """Imprime texto raw directamente a impresora Windows"""
         try:
@@ -263,240 +253,179 @@ class PrinterManager:
             print(f"Error imprimiendo: {e}")
             raise e
 
-    def _generate_ticket_text(self, items, total, ticket_num=None):
-        """Genera el texto del ticket"""
-        now = datetime.now()
-        
-        lines = []
-        lines.append("=" * 32)
-        lines.append("         Mi comalito")
-        lines.append("    Gorditas y Antojitos")
-        lines.append("=" * 32)
-        lines.append(f"Fecha: {now.strftime('%d/%m/%Y')}")
-        lines.append(f"Hora:  {now.strftime('%H:%M:%S')}")
-        
-        if ticket_num:
-            lines.append(f"Ticket: #{ticket_num}")
-        
-        lines.append("-" * 32)
-        
-        for item in items:
-            qty = item.get("qty", 1)
-            categoria = item.get("categoria", "")
-            tipo = item.get("tipo", "")
-            subtotal = item.get("subtotal", 0)
-            
-            producto = f"{categoria}"
-            if tipo:
-                producto += f" - {tipo}"
-            
-            lines.append(f"{qty} x {producto}")
-            lines.append(f"              ${subtotal:.2f}")
-        
-        lines.append("-" * 32)
-        lines.append(f"TOTAL: ${total:.2f}")
-        lines.append("=" * 32)
-        lines.append("  GRACIAS POR SU COMPRA!")
-        lines.append("=" * 32)
-        lines.append("")
-        lines.append("")
-        lines.append("")
-        lines.append("\x1d\x56\x00")  # Comando ESC/POS para cortar papel
-        
-        return "\n".join(lines)
-
-    def _generate_test_text(self):
-        """Genera texto de prueba"""
-        now = datetime.now()
-        
-        lines = []
-        lines.append("=" * 32)
-        lines.append("        PRUEBA")
-        lines.append("=" * 32)
-        lines.append(f"Fecha: {now.strftime('%d/%m/%Y %H:%M')}")
-        lines.append("")
-        lines.append("Si puedes leer esto,")
-        lines.append("la impresora funciona")
-        lines.append("correctamente!")
-        lines.append("")
-        lines.append("=" * 32)
-        lines.append("")
-        lines.append("")
-        lines.append("")
-        lines.append("\x1d\x56\x00")  # Cortar papel
-        
-        return "\n".join(lines)
-
-    def _generate_corte_text(self, total_vendido, tickets_pagados):
-        """Genera texto del corte"""
-        now = datetime.now()
-        
-        lines = []
-        lines.append("=" * 32)
-        lines.append("     CORTE DEL DIA")
-        lines.append("        MICHEL")
-        lines.append("=" * 32)
-        lines.append(f"Fecha: {now.strftime('%d/%m/%Y')}")
-        lines.append(f"Hora:  {now.strftime('%H:%M:%S')}")
-        lines.append("-" * 32)
-        lines.append(f"Tickets cobrados: {tickets_pagados}")
-        lines.append(f"TOTAL: ${total_vendido:.2f}")
-        lines.append("-" * 32)
-        lines.append("     FIN DEL CORTE")
-        lines.append("=" * 32)
-        lines.append("")
-        lines.append("")
-        lines.append("")
-        lines.append("\x1d\x56\x00")  # Cortar papel
-        
-        return "\n".join(lines)
-
-    def print_ticket(self, items, total, ticket_num=None):
-        """Imprime un ticket de venta"""
+    def _recibo(self, plantilla, datos):
+        """Imprime una plantilla de plantillas_recibo con el backend conectado"""
+        return self.imprimir_lote([(plantilla, datos)])
+
+    def imprimir_lote(self, recibos, impreso=None):
+        """
+        Imprime varios recibos [(plantilla, datos)] con la misma conexión.
+        Windows: un solo documento (el spooler lo acepta completo o no).
+        USB y Red: una escritura por recibo, llamando impreso(i) tras cada
+        una, para que un error a la mitad no reimprima los anteriores.
+        Cada plantilla termina con su corte de papel.
+        """
         if not self.printer:
             return False
 
         try:
             if self.printer_type == "windows":
-                text = self._generate_ticket_text(items, total, ticket_num)
-                return self._print_windows_raw(text)
+                self._print_windows_raw("".join(
+                    a_texto(plantilla, datos) for plantilla, datos in recibos
+                ))
+                if impreso:
+                    for i in range(len(recibos)):
+                        impreso(i)
+                return True
             else:
-                # Método ESC/POS para USB y Red
-                p = self.printer
-                now = datetime.now()
-
+                # ESC/POS para USB y Red: cada recibo en un solo buffer
+                logo = None
                 try:
-                    if os.path.exists("logo_escpos.png"):
-                        p.set(align='center')
-                        p.image("logo_escpos.png")   # Máx 384 px
-                        p.text("\n")
+                    logo = cargar_logo()
                 except Exception as e:
                     print("Error logo:", e)
 
-                p.set(align='center')
-                p.text("=" * 32 + "\n")
-                p.set(align='center', text_type='B', width=2, height=2)
-                p.text("MICHEL\n")
-                p.set(align='center', text_type='normal', width=1, height=1)
-                p.text("Gorditas y Antojitos\n")
-                p.text("=" * 32 + "\n")
-
-                p.text(f"Fecha: {now.strftime('%d/%m/%Y')}\n")
-                p.text(f"Hora:  {now.strftime('%H:%M:%S')}\n")
-
-                if ticket_num:
-                    p.text(f"Ticket: #{ticket_num}\n")
-
-                p.text("-" * 32 + "\n")
-                p.set(align='left')
-
-                for item in items:
-                    qty = item.get("qty", 1)
-                    categoria = item.get("categoria", "")
-                    tipo = item.get("tipo", "")
-                    subtotal = item.get("subtotal", 0)
-
-                    producto = f"{categoria}"
-                    if tipo:
-                        producto += f" - {tipo}"
-
-                    p.text(f"{qty} x {producto}\n")
-                    p.set(align='right')
-                    p.text(f"${subtotal:.2f}\n")
-                    p.set(align='left')
-
-                p.text("-" * 32 + "\n")
-                p.set(align='right', text_type='B', width=2, height=2)
-                p.text(f"TOTAL: ${total:.2f}\n")
-
-                p.set(align='center', text_type='normal', width=1, height=1)
-                p.text("=" * 32 + "\n")
-                p.text("GRACIAS POR SU COMPRA!\n")
-                p.text("=" * 32 + "\n")
-                p.text("\n\n\n")
-                p.cut()
-
+                for i, (plantilla, datos) in enumerate(recibos):
+                    enviar(self.printer, a_escpos(plantilla, datos, logo))
+                    if impreso:
+                        impreso(i)
                 return True
 
         except Exception as e:
             print(f"Error: {e}")
             return False
 
+    def print_ticket(self, ticket, ticket_num=None, fecha=None):
+        """Imprime un modelo_ticket.Ticket (fecha: momento del cobro, si se imprime después)"""
+        return self._recibo("ticket", {
+            "fecha": fecha or datetime.now(),
+            "items": ticket.to_dicts(),
+            "total": ticket.total,
+            "ticket_num": ticket_num
+        })
+
     def print_test(self):
         """Imprime una página de prueba"""
-        if not self.printer:
-            return False
+        return self._recibo("prueba", {"fecha": datetime.now()})
 
-        try:
-            if self.printer_type == "windows":
-                text = self._generate_test_text()
-                return self._print_windows_raw(text)
-            else:
-                p = self.printer
-                now = datetime.now()
-
-                p.set(align='center')
-                p.text("=" * 32 + "\n")
-                p.set(align='center', text_type='B', width=2, height=2)
-                p.text("PRUEBA\n")
-                p.set(align='center', text_type='normal', width=1, height=1)
-                p.text("=" * 32 + "\n")
-                p.text(f"Fecha: {now.strftime('%d/%m/%Y %H:%M')}\n")
-                p.text("\n")
-                p.text("Si puedes leer esto,\n")
-                p.text("la impresora funciona\n")
-                p.text("correctamente!\n")
-                p.text("\n")
-                p.text("=" * 32 + "\n")
-                p.text("\n\n\n")
-                p.cut()
+    def print_corte(self, corte, fecha=None):
+        """Imprime el corte del día (modelo_ticket.Corte)"""
+        return self._recibo("corte", {
+            "fecha": fecha or datetime.now(),
+            "total_vendido": corte.total_vendido,
+            "tickets_pagados": corte.tickets
+        })
 
-                return True
 
-        except Exception as e:
-            print(f"Error: {e}")
-            return False
+class SesionImpresora:
+    """
+    Conexión de impresora compartida por todo el proceso.
+    Se conecta la primera vez que se usa y solo reconecta si una
+    impresión falla, si cambia la configuración o si tras un rato sin
+    uso la impresora ya no responde.
+    """
 
-    def print_corte(self, total_vendido, tickets_pagados):
-        """Imprime el corte del día"""
-        if not self.printer:
-            return False
+    # Segundos sin uso tras los cuales se verifica la conexión
+    INACTIVIDAD = 60
 
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._pm = None
+        self._ultimo_uso = 0.0
+        # Marcada desde cualquier hilo; se reconecta en el siguiente uso
+        self._vencida = threading.Event()
+
+    def _conectar(self):
+        pm = PrinterManager()
+        if not pm.config:
+            return None
+        if (pm.config.get("type") in ("usb", "network")
+                and importlib.util.find_spec("escpos") is None):
+            # Sin python-escpos, como antes: no se imprime
+            return None
+        if not pm.connect_from_config():
+            raise ConnectionError("No se pudo conectar a la impresora")
+        return pm
+
+    def _sigue_viva(self):
+        """Verificación ligera antes de usar una conexión inactiva"""
+        if time.monotonic() - self._ultimo_uso < self.INACTIVIDAD:
+            return True
         try:
-            if self.printer_type == "windows":
-                text = self._generate_corte_text(total_vendido, tickets_pagados)
-                return self._print_windows_raw(text)
+            # python-escpos >= 3 consulta el estado con DLE EOT
+            if hasattr(self._pm.printer, "is_online"):
+                with self._pm.lectura_corta():
+                    return bool(self._pm.printer.is_online())
+        except Exception:
+            return False
+        return True
+
+    def usar(self, accion):
+        """
+        Ejecuta accion(printer_manager) con la conexión compartida.
+        Devuelve None si no hay impresora configurada, si no, el
+        resultado de la acción (False si falló).
+        """
+        with self._lock:
+            try:
+                self._renovar()
+                if self._pm is not None and not self._sigue_viva():
+                    self._desconectar()
+                if self._pm is None:
+                    self._pm = self._conectar()
+                    if self._pm is None:
+                        return None
+
+                resultado = accion(self._pm)
+            except Exception as e:
+                print(f"Error de impresora: {e}")
+                resultado = False
+
+            if resultado:
+                self._ultimo_uso = time.monotonic()
             else:
-                p = self.printer
-                now = datetime.now()
-
-                p.set(align='center')
-                p.text("=" * 32 + "\n")
-                p.set(align='center', text_type='B', width=2, height=2)
-                p.text("CORTE DEL DIA\n")
-                p.set(align='center', text_type='normal', width=1, height=1)
-                p.text("MICHEL\n")
-                p.text("=" * 32 + "\n")
-
-                p.text(f"Fecha: {now.strftime('%d/%m/%Y')}\n")
-                p.text(f"Hora:  {now.strftime('%H:%M:%S')}\n")
-                p.text("-" * 32 + "\n")
-
-                p.set(align='left')
-                p.text(f"Tickets cobrados: {tickets_pagados}\n")
-
-                p.set(align='right', text_type='B', width=2, height=1)
-                p.text(f"TOTAL: ${total_vendido:.2f}\n")
-
-                p.set(align='center', text_type='normal', width=1, height=1)
-                p.text("-" * 32 + "\n")
-                p.text("FIN DEL CORTE\n")
-                p.text("=" * 32 + "\n")
-                p.text("\n\n\n")
-                p.cut()
-
-                return True
-
-        except Exception as e:
-            print(f"Error: {e}")
-            return False
\ No newline at end of file
+                # Reconectar en el próximo trabajo
+                self._desconectar()
+            return resultado
+
+    def consultar_estado(self):
+        """
+        Estado para el monitor. Nunca invalida la sesión: que la impresora
+        no conteste una consulta no significa que la conexión esté rota, y
+        de reconectar se encarga el siguiente trabajo de impresión.
+        Devuelve None si no hay impresora configurada, False si no conecta.
+        """
+        with self._lock:
+            self._renovar()
+            if self._pm is None:
+                try:
+                    self._pm = self._conectar()
+                except Exception as e:
+                    print(f"Error de impresora: {e}")
+                    return False
+                if self._pm is None:
+                    return None
+            return self._pm.consultar_estado()
+
+    def invalidar(self):
+        """
+        Pide reconectar (p. ej. cambió la configuración). No espera el
+        lock: se puede llamar desde la interfaz aunque haya una impresión
+        en curso; quien use la sesión después cierra la conexión vieja.
+        """
+        self._vencida.set()
+
+    def _renovar(self):
+        # Solo con el lock tomado
+        if self._vencida.is_set():
+            self._vencida.clear()
+            self._desconectar()
+
+    def _desconectar(self):
+        # Solo con el lock tomado
+        if self._pm is not None:
+            self._pm.disconnect()
+        self._pm = None
+
+
+SESION = SesionImpresora()
@@ -0,0 +1,161 @@
+"""
+Libro de ventas: un registro por ticket cobrado
+La escritura ocurre en un hilo aparte que agrupa los tickets en lotes
+(una transacción por lote), así el cobro nunca espera al disco.
+Si la base está ocupada el lote se reintenta hasta que se guarda; lo
+que no alcance a guardarse al cerrar la aplicación se aparta en un
+archivo y entra en el siguiente arranque.
+"""
+import atexit
+import json
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import almacen
+
+# Tiempo máximo que un ticket espera en memoria antes de ir a disco
+ESPERA_LOTE = 0.5
+MAX_LOTE = 64
+
+# Espera entre reintentos: 0.5, 1, 2... segundos, hasta 30
+ESPERA_BASE = 0.5
+ESPERA_MAX = 30
+
+# Al cerrar no se espera para siempre a la base
+INTENTOS_AL_CERRAR = 3
+PENDIENTES = Path("registros/ventas_pendientes.jsonl")
+
+_FIN = object()
+
+
+class EscritorVentas:
+    """Escribe ventas al almacén desde un hilo en segundo plano"""
+
+    def __init__(self):
+        self._cola = queue.Queue()
+        self._hilo = None
+        self._lock = threading.Lock()
+        self._cerrando = threading.Event()
+
+    def _iniciar(self):
+        with self._lock:
+            if self._hilo is None:
+                self._hilo = threading.Thread(
+                    target=self._run, name="EscritorVentas", daemon=True
+                )
+                self._hilo.start()
+                atexit.register(self.cerrar)
+
+    def agregar(self, venta):
+        """Encola una venta; regresa de inmediato"""
+        self._iniciar()
+        self._cola.put(venta)
+
+    def _run(self):
+        self._recuperar()
+
+        terminar = False
+        while not terminar:
+            primero = self._cola.get()
+            if primero is _FIN:
+                break
+
+            lote = [primero]
+            while len(lote) < MAX_LOTE:
+                try:
+                    venta = self._cola.get(timeout=ESPERA_LOTE)
+                except queue.Empty:
+                    break
+                if venta is _FIN:
+                    terminar = True
+                    break
+                lote.append(venta)
+
+            self._guardar(lote)
+
+    def _guardar(self, lote):
+        """El lote se conserva y se reintenta hasta que la transacción entra"""
+        espera = ESPERA_BASE
+        al_cerrar = 0
+        while True:
+            try:
+                almacen.agregar_ventas(lote)
+                return
+            except Exception as e:
+                print(f"Error guardando ventas (se reintenta): {e}")
+
+            if not self._cerrando.is_set():
+                self._cerrando.wait(espera)
+                espera = min(espera * 2, ESPERA_MAX)
+                continue
+
+            al_cerrar += 1
+            if al_cerrar >= INTENTOS_AL_CERRAR:
+                self._apartar(lote)
+                return
+            time.sleep(ESPERA_BASE)
+
+    # =========================
+    # PENDIENTES ENTRE SESIONES
+    # =========================
+    def _apartar(self, lote):
+        """Último recurso al cerrar: las ventas van a un archivo aparte"""
+        try:
+            PENDIENTES.parent.mkdir(parents=True, exist_ok=True)
+            with open(PENDIENTES, "a", encoding="utf-8") as f:
+                for venta in lote:
+                    f.write(json.dumps(venta, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"No se pudieron apartar {len(lote)} ventas: {e}")
+
+    def _recuperar(self):
+        """Guarda las ventas apartadas en una sesión anterior"""
+        if not PENDIENTES.exists():
+            return
+
+        ventas = []
+        try:
+            with open(PENDIENTES, "r", encoding="utf-8") as f:
+                for linea in f:
+                    try:
+                        ventas.append(json.loads(linea))
+                    except ValueError:
+                        # Línea a medias: se ignora
+                        continue
+            almacen.agregar_ventas(ventas)
+            PENDIENTES.unlink()
+        except Exception as e:
+            # El archivo se queda para el siguiente arranque
+            print(f"Error recuperando ventas pendientes: {e}")
+
+    def cerrar(self):
+        """Vacía la cola y espera a que todo quede en disco (o apartado)"""
+        if self._hilo is None or not self._hilo.is_alive():
+            return
+        self._cerrando.set()
+        self._cola.put(_FIN)
+        self._hilo.join()
+
+
+ESCRITOR = EscritorVentas()
+
+
+def guardar_venta(ticket, ticket_num=None):
+    """Registra un ticket cobrado (fecha, hora, número, total y productos)"""
+    ahora = datetime.now()
+    venta = {
+        "fecha": ahora.strftime("%Y-%m-%d"),
+        "hora": ahora.strftime("%H:%M:%S"),
+        "ticket": ticket_num,
+        "total": ticket.total,
+        "items": ticket.to_dicts()
+    }
+    ESCRITOR.agregar(venta)
+
+
+def leer_ventas(desde=None, hasta=None):
+    """Devuelve las ventas registradas en el rango de fechas"""
+    return almacen.listar_ventas(desde, hasta)
@@ -0,0 +1,111 @@
+"""
+Logo del ticket ya convertido a bytes ESC/POS (GS v 0)
+Se rasteriza una sola vez y se guarda junto al PNG; el caché se
+invalida cuando cambia el hash del PNG. Si la carpeta es de solo
+lectura (p. ej. instalado en Program Files) el logo queda solo en
+memoria durante la sesión.
+"""
+import os
+import threading
+from pathlib import Path
+
+LOGO = Path("logo_escpos.png")
+CACHE = Path("logo_escpos.bin")
+
+_MAGIA = b"ESCPOS-LOGO-1\n"
+# Algunas impresoras baratas no aceptan imágenes muy altas en un solo comando
+FRAGMENTO = 256
+
+_lock = threading.Lock()
+_memoria = {"firma": None, "datos": None}
+
+
+def _hash(path):
+    import hashlib
+
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def rasterizar(img):
+    """Convierte una imagen PIL a comandos GS v 0 (1 = punto negro)"""
+    from PIL import Image
+
+    img = img.convert("1")
+    ancho, alto = img.size
+    ancho_bytes = (ancho + 7) // 8
+
+    # Rellenar a múltiplo de 8 con blanco para no imprimir basura al borde
+    lienzo = Image.new("1", (ancho_bytes * 8, alto), 1)
+    lienzo.paste(img, (0, 0))
+
+    # En modo "1" de PIL el bit 1 es blanco; ESC/POS usa 1 = negro
+    filas = bytes(b ^ 0xFF for b in lienzo.tobytes())
+
+    salida = bytearray()
+    for y in range(0, alto, FRAGMENTO):
+        alto_frag = min(FRAGMENTO, alto - y)
+        salida += b"\x1d\x76\x30\x00"
+        salida += bytes((ancho_bytes & 0xFF, ancho_bytes >> 8,
+                         alto_frag & 0xFF, alto_frag >> 8))
+        salida += filas[y * ancho_bytes:(y + alto_frag) * ancho_bytes]
+    return bytes(salida)
+
+
+def generar_cache(png=LOGO, cache=CACHE):
+    """Rasteriza el PNG y guarda el resultado con el hash del PNG"""
+    from PIL import Image
+
+    datos = rasterizar(Image.open(png))
+    try:
+        _escribir_cache(png, cache, datos)
+    except OSError as e:
+        # Sin permiso de escritura: se imprime igual con lo rasterizado
+        print(f"No se pudo guardar {cache}: {e}")
+    return datos
+
+
+def _escribir_cache(png, cache, datos):
+    temporal = Path(str(cache) + ".tmp")
+    with open(temporal, "wb") as f:
+        f.write(_MAGIA + _hash(png) + datos)
+    os.replace(temporal, cache)
+
+
+def _leer_cache(png, cache):
+    try:
+        with open(cache, "rb") as f:
+            contenido = f.read()
+    except OSError:
+        return None
+
+    inicio = len(_MAGIA)
+    if not contenido.startswith(_MAGIA):
+        return None
+    if contenido[inicio:inicio + 32] != _hash(png):
+        return None
+    return contenido[inicio + 32:]
+
+
+def cargar_logo(png=LOGO, cache=CACHE):
+    """
+    Bytes ESC/POS del logo, o None si no hay logo.
+    En memoria se reutilizan mientras el PNG no cambie de fecha o tamaño.
+    """
+    try:
+        st = os.stat(png)
+    except FileNotFoundError:
+        return None
+    firma = (str(png), st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        if _memoria["firma"] == firma:
+            return _memoria["datos"]
+
+        datos = _leer_cache(png, cache)
+        if datos is None:
+            datos = generar_cache(png, cache)
+
+        _memoria["firma"] = firma
+        _memoria["datos"] = datos
+        return datos
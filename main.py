@@ -1,12 +1,25 @@
 # main.py
 import sys
 import os
+
+# Reporte de tiempos de import: antes de cargar Qt para medirlo completo
+if __name__ == "__main__" and "--diagnostico" in sys.argv:
+    import diagnostico
+    sys.exit(diagnostico.principal())
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit,
     QPushButton, QVBoxLayout, QMessageBox
 )
-from PyQt5.QtGui import QPixmap, QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer
+import imagenes
+import tema
+
+
+# Milisegundos antes de empezar a precalentar y entre cada etapa
+ESPERA_PRECALENTAR = 300
+PAUSA_ETAPA = 30
 
 
 def resource_path(relative_path):
@@ -28,60 +41,35 @@ class LoginWindow(QWidget):
         self.background = QLabel(self)
         self.background.setGeometry(0, 0, 700, 500)
 
-        pixmap = QPixmap(resource_path("background.jpg"))
-        if not pixmap.isNull():
+        ruta = resource_path("background.jpg")
+        if not imagenes.pixmap(ruta).isNull():
             self.background.setPixmap(
-                pixmap.scaled(700, 500, Qt.IgnoreAspectRatio)
+                imagenes.escalar(ruta, self.size(), Qt.IgnoreAspectRatio)
             )
         self.background.lower()
 
         # -------- Título --------
         self.title = QLabel("Hanna te vigila Trabaja")
         self.title.setFont(QFont("Arial", 24, QFont.Bold))
-        self.title.setStyleSheet("color: black;")
+        tema.clase(self.title, "login")
 
         # -------- Usuario --------
         self.user_input = QLineEdit()
         self.user_input.setPlaceholderText("Usuario")
         self.user_input.setFixedHeight(45)
-        self.user_input.setStyleSheet("""
-            QLineEdit {
-                border-radius: 22px;
-                padding-left: 15px;
-                font-size: 16px;
-                background: white;
-            }
-        """)
+        tema.clase(self.user_input, "login")
 
         # -------- Contraseña --------
         self.pass_input = QLineEdit()
         self.pass_input.setPlaceholderText("Contraseña")
         self.pass_input.setEchoMode(QLineEdit.Password)
         self.pass_input.setFixedHeight(45)
-        self.pass_input.setStyleSheet("""
-            QLineEdit {
-                border-radius: 22px;
-                padding-left: 15px;
-                font-size: 16px;
-                background: white;
-            }
-        """)
+        tema.clase(self.pass_input, "login")
 
         # -------- Botón Entrar --------
         self.login_btn = QPushButton("Entrar")
         self.login_btn.setFixedHeight(50)
-        self.login_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border-radius: 25px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1558b0;
-            }
-        """)
+        tema.clase(self.login_btn, "login")
         self.login_btn.clicked.connect(self.verify_login)
 
         # -------- Layout --------
@@ -99,16 +87,47 @@ class LoginWindow(QWidget):
         layout.setContentsMargins(120, 40, 120, 40)
         self.setLayout(layout)
 
+        # -------- Ventana principal (se arma mientras se escribe) --------
+        self.pos = None
+        QTimer.singleShot(ESPERA_PRECALENTAR, self._precalentar)
+
+    # -------- Precalentar --------
+    def _precalentar(self, etapa=0):
+        """
+        Prepara la ventana principal por etapas, una por vuelta del event
+        loop, para que el login siga respondiendo: importar módulos,
+        decodificar la imagen del menú y construir POSWindow oculta.
+        """
+        if self.pos is not None or not self.isVisible():
+            return
+
+        try:
+            if etapa == 0:
+                import pos  # noqa: F401
+            elif etapa == 1:
+                imagenes.precargar(resource_path("comidas.jpg"))
+            else:
+                from pos import POSWindow
+                self.pos = POSWindow()
+                return
+        except Exception as e:
+            print(f"Error precalentando ventana principal: {e}")
+            return
+
+        QTimer.singleShot(PAUSA_ETAPA, lambda: self._precalentar(etapa + 1))
+
     # -------- Login --------
     def verify_login(self):
         user = self.user_input.text().strip()
         pw = self.pass_input.text().strip()
 
         if user == "admin" and pw == "1234":
-            from pos import POSWindow
+            # Normalmente ya quedó construida durante el login
+            if self.pos is None:
+                from pos import POSWindow
+                self.pos = POSWindow()
 
-            self.pos = POSWindow()
-            self.pos.show()
+            self.pos.mostrar()
             self.close()
         else:
             QMessageBox.warning(self, "Error", "Usuario o contraseña incorrectos")
@@ -116,6 +135,7 @@ class LoginWindow(QWidget):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    tema.aplicar(app)
     login = LoginWindow()
     login.show()
     sys.exit(app.exec_())
\ No newline at end of file
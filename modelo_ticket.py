@@ -0,0 +1,140 @@
+"""
+Modelo del ticket y del corte
+El dinero se guarda en centavos enteros: las sumas son exactas sin
+importar cuántos tickets lleve el corte, y el total se actualiza al
+agregar, cambiar o quitar un producto sin recorrer la lista.
+
+Los diálogos siguen entregando diccionarios con el precio en pesos;
+to_dict() regresa el mismo formato para la cola, el libro de ventas y
+las plantillas de impresión.
+"""
+
+
+def a_centavos(pesos):
+    return round(pesos * 100)
+
+
+def a_pesos(centavos):
+    return centavos / 100
+
+
+class LineItem:
+    """Un renglón del ticket"""
+    __slots__ = ("categoria", "tipo", "qty", "precio_centavos", "guisos")
+
+    def __init__(self, categoria, tipo="", qty=1, precio_centavos=0, guisos=None):
+        self.categoria = categoria
+        self.tipo = tipo
+        self.qty = qty
+        self.precio_centavos = precio_centavos
+        self.guisos = guisos
+
+    @classmethod
+    def de_dict(cls, data):
+        """Desde el diccionario de un diálogo ({"categoria", "tipo", "qty", "price"})"""
+        return cls(
+            data["categoria"],
+            data.get("tipo", ""),
+            data["qty"],
+            a_centavos(data["price"]),
+            data.get("guisos")
+        )
+
+    @property
+    def subtotal_centavos(self):
+        return self.qty * self.precio_centavos
+
+    @property
+    def price(self):
+        return a_pesos(self.precio_centavos)
+
+    @property
+    def subtotal(self):
+        return a_pesos(self.subtotal_centavos)
+
+    def texto(self):
+        """Renglón como se ve en la lista del ticket"""
+        texto = f"{self.qty} x {self.categoria}"
+        if self.tipo:
+            texto += f" - {self.tipo}"
+        return texto + f"     ${self.subtotal:.2f}"
+
+    def to_dict(self):
+        data = {
+            "categoria": self.categoria,
+            "tipo": self.tipo,
+            "qty": self.qty,
+            "price": self.price,
+            "subtotal": self.subtotal
+        }
+        if self.guisos is not None:
+            data["guisos"] = self.guisos
+        return data
+
+
+class Ticket:
+    """Productos del ticket en curso y su total"""
+    __slots__ = ("items", "total_centavos")
+
+    def __init__(self):
+        self.items = []
+        self.total_centavos = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, row):
+        return self.items[row]
+
+    @property
+    def total(self):
+        return a_pesos(self.total_centavos)
+
+    def agregar(self, item):
+        self.items.append(item)
+        self.total_centavos += item.subtotal_centavos
+
+    def reemplazar(self, row, item):
+        self.total_centavos += item.subtotal_centavos - self.items[row].subtotal_centavos
+        self.items[row] = item
+
+    def quitar(self, row):
+        item = self.items.pop(row)
+        self.total_centavos -= item.subtotal_centavos
+        return item
+
+    def limpiar(self):
+        self.items.clear()
+        self.total_centavos = 0
+
+    def to_dicts(self):
+        return [item.to_dict() for item in self.items]
+
+
+class Corte:
+    """Acumulado del día hasta el siguiente corte"""
+    __slots__ = ("total_centavos", "tickets")
+
+    def __init__(self):
+        self.total_centavos = 0
+        self.tickets = 0
+
+    @property
+    def total_vendido(self):
+        return a_pesos(self.total_centavos)
+
+    def siguiente_numero(self):
+        """Número que llevará el próximo ticket cobrado"""
+        return self.tickets + 1
+
+    def registrar(self, ticket):
+        """Suma un ticket cobrado"""
+        self.total_centavos += ticket.total_centavos
+        self.tickets += 1
+
+    def reiniciar(self):
+        self.total_centavos = 0
+        self.tickets = 0
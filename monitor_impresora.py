@@ -0,0 +1,77 @@
+"""
+Monitor del estado de la impresora
+Un hilo consulta la impresora cada cierto tiempo (a través de la sesión
+compartida, así que nunca choca con una impresión) y guarda el último
+estado. La consulta tiene un tiempo de espera corto y nunca cierra la
+conexión compartida. La interfaz solo lee ese estado; nadie en el cobro
+pregunta a la impresora directamente.
+"""
+import threading
+import time
+
+# Segundos entre consultas
+INTERVALO = 20
+
+SIN_CONFIGURAR = {"estado": "sin_configurar", "detalle": "Sin configurar"}
+DESCONECTADA = {"estado": "desconectada", "detalle": "No responde"}
+
+
+class MonitorImpresora:
+    """Hilo que mantiene en caché el estado de la impresora"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._despertar = threading.Event()
+        self._hilo = None
+        self._estado = {"estado": "desconocido", "detalle": "Revisando...", "hora": None}
+
+    def iniciar(self):
+        with self._lock:
+            if self._hilo is None:
+                self._hilo = threading.Thread(
+                    target=self._run, name="MonitorImpresora", daemon=True
+                )
+                self._hilo.start()
+
+    def estado(self):
+        """Último estado conocido (no toca la impresora)"""
+        with self._lock:
+            return dict(self._estado)
+
+    def revisar(self):
+        """Adelanta la siguiente consulta (p. ej. tras una impresión fallida)"""
+        self._despertar.set()
+
+    # =========================
+    # HILO
+    # =========================
+    def _run(self):
+        while True:
+            estado = dict(self._consultar())
+            estado["hora"] = time.time()
+            with self._lock:
+                self._estado = estado
+
+            self._despertar.wait(INTERVALO)
+            self._despertar.clear()
+
+    def _consultar(self):
+        try:
+            from impresora import SESION
+        except ImportError:
+            return SIN_CONFIGURAR
+
+        try:
+            resultado = SESION.consultar_estado()
+        except Exception as e:
+            print(f"Error consultando impresora: {e}")
+            resultado = False
+
+        if resultado is None:
+            return SIN_CONFIGURAR
+        if not resultado:
+            return DESCONECTADA
+        return resultado
+
+
+MONITOR = MonitorImpresora()
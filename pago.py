@@ -3,6 +3,9 @@ from PyQt5.QtWidgets import (
     QVBoxLayout, QMessageBox, QCheckBox
 )
 from PyQt5.QtCore import Qt
+import tema
+from libro_ventas import guardar_venta
+from cola_impresion import imprimir_ticket
 
 
 class PaymentDialog(QDialog):
@@ -21,57 +24,25 @@ class PaymentDialog(QDialog):
 
         title = QLabel("TOTAL A PAGAR")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        tema.clase(title, "subtitulo")
 
-        total = QLabel(f"${self.ticket.total:.2f}")
+        total = QLabel(f"${self.ticket.modelo.total:.2f}")
         total.setAlignment(Qt.AlignCenter)
-        total.setStyleSheet(
-            "font-size: 32px; font-weight: bold; color: #1a73e8;"
-        )
+        tema.clase(total, "total")
 
         # Checkbox para imprimir ticket
         self.check_print = QCheckBox("Imprimir ticket")
         self.check_print.setChecked(True)
-        self.check_print.setStyleSheet("""
-            QCheckBox {
-                font-size: 16px;
-                padding: 10px;
-            }
-            QCheckBox::indicator {
-                width: 22px;
-                height: 22px;
-            }
-        """)
+        tema.clase(self.check_print, "imprimir")
 
         btn_pay = QPushButton("CONFIRMAR PAGO")
         btn_pay.setFixedHeight(60)
-        btn_pay.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                border-radius: 16px;
-            }
-            QPushButton:hover {
-                background-color: #1558b0;
-            }
-        """)
+        tema.clase(btn_pay, "confirmar")
         btn_pay.clicked.connect(self.confirm_payment)
 
         btn_cancel = QPushButton("Cancelar")
         btn_cancel.setFixedHeight(45)
-        btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                font-size: 14px;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                background-color: #ccc;
-            }
-        """)
+        tema.clase(btn_cancel, "secundario")
         btn_cancel.clicked.connect(self.reject)
 
         layout.addWidget(title)
@@ -86,36 +57,16 @@ class PaymentDialog(QDialog):
         if self.check_print.isChecked():
             self.print_ticket()
 
+        # Registrar la venta (se escribe en segundo plano)
+        guardar_venta(self.ticket.modelo, self.ticket.corte.siguiente_numero())
+
         # Actualizar totales
-        self.ticket.total_vendido += self.ticket.total
-        self.ticket.tickets_pagados += 1
+        self.ticket.corte.registrar(self.ticket.modelo)
 
         QMessageBox.information(self, "Pago", "Pago realizado con éxito")
         self.ticket.clear()
         self.accept()
 
     def print_ticket(self):
-        """Intenta imprimir el ticket - NO falla si no hay impresora"""
-        try:
-            from impresora import PrinterManager
-
-            pm = PrinterManager()
-
-            # Si no hay configuración, simplemente no imprime
-            if not pm.config:
-                return
-
-            # Intentar conectar e imprimir
-            if pm.connect_from_config():
-                pm.print_ticket(
-                    self.ticket.items_data,
-                    self.ticket.total,
-                    self.ticket.tickets_pagados + 1
-                )
-
-        except ImportError:
-            # Si no está el módulo, simplemente no imprime
-            pass
-        except Exception:
-            # Cualquier error, simplemente no imprime
-            pass
\ No newline at end of file
+        """Encola el ticket para imprimir - el cobro no espera a la impresora"""
+        imprimir_ticket(self.ticket.modelo, self.ticket.corte.siguiente_numero())
@@ -0,0 +1,199 @@
+"""
+Plantillas declarativas de ticket, corte y prueba
+Cada plantilla se compila una sola vez a una lista de operaciones (con
+los comandos de estilo ya codificados) y de ahí salen las tres
+versiones: bytes ESC/POS, texto para Windows RAW y vista previa.
+"""
+from functools import lru_cache
+import string
+
+from recibo_escpos import ESC, GS, comandos_estilo
+
+ANCHO = 32
+
+# Nombre del negocio en todos los recibos
+NEGOCIO = "MICHEL"
+
+# =========================
+# PLANTILLAS
+# =========================
+# texto: formato de str.format con los datos del recibo
+# si:    solo se imprime si ese dato tiene valor
+# items: sub-plantilla que se repite por cada producto
+TITULO = {"align": "center", "bold": True, "width": 2, "height": 2}
+CENTRO = {"align": "center"}
+
+PLANTILLAS = {
+    "ticket": [
+        {"logo": True},
+        {"linea": "=", **CENTRO},
+        {"texto": NEGOCIO, **TITULO},
+        {"texto": "Gorditas y Antojitos", **CENTRO},
+        {"linea": "=", **CENTRO},
+        {"texto": "Fecha: {fecha:%d/%m/%Y}", **CENTRO},
+        {"texto": "Hora:  {fecha:%H:%M:%S}", **CENTRO},
+        {"texto": "Ticket: #{ticket_num}", "si": "ticket_num", **CENTRO},
+        {"linea": "-", **CENTRO},
+        {"items": [
+            {"texto": "{qty} x {producto}"},
+            {"texto": "${subtotal:.2f}", "align": "right"},
+        ]},
+        {"linea": "-"},
+        {"texto": "TOTAL: ${total:.2f}", "align": "right", "bold": True,
+         "width": 2, "height": 2},
+        {"linea": "=", **CENTRO},
+        {"texto": "GRACIAS POR SU COMPRA!", **CENTRO},
+        {"linea": "=", **CENTRO},
+        {"corte": True},
+    ],
+    "corte": [
+        {"linea": "=", **CENTRO},
+        {"texto": "CORTE DEL DIA", **TITULO},
+        {"texto": NEGOCIO, **CENTRO},
+        {"linea": "=", **CENTRO},
+        {"texto": "Fecha: {fecha:%d/%m/%Y}", **CENTRO},
+        {"texto": "Hora:  {fecha:%H:%M:%S}", **CENTRO},
+        {"linea": "-", **CENTRO},
+        {"texto": "Tickets cobrados: {tickets_pagados}"},
+        {"texto": "TOTAL: ${total_vendido:.2f}", "align": "right", "bold": True,
+         "width": 2},
+        {"linea": "-", **CENTRO},
+        {"texto": "FIN DEL CORTE", **CENTRO},
+        {"linea": "=", **CENTRO},
+        {"corte": True},
+    ],
+    "prueba": [
+        {"linea": "=", **CENTRO},
+        {"texto": "PRUEBA", **TITULO},
+        {"linea": "=", **CENTRO},
+        {"texto": "Fecha: {fecha:%d/%m/%Y %H:%M}", **CENTRO},
+        {"texto": "", **CENTRO},
+        {"texto": "Si puedes leer esto,", **CENTRO},
+        {"texto": "la impresora funciona", **CENTRO},
+        {"texto": "correctamente!", **CENTRO},
+        {"texto": "", **CENTRO},
+        {"linea": "=", **CENTRO},
+        {"corte": True},
+    ],
+}
+
+
+# =========================
+# COMPILACIÓN
+# =========================
+class Op:
+    """Operación compilada de una plantilla"""
+    __slots__ = ("tipo", "formato", "campos", "align", "si",
+                 "estilo", "estatico", "hijos")
+
+    def __init__(self, tipo, formato="", align="left", si=None,
+                 estilo=b"", hijos=()):
+        self.tipo = tipo
+        self.formato = formato
+        self.campos = {
+            campo for _, campo, _, _ in string.Formatter().parse(formato)
+            if campo
+        }
+        self.align = align
+        self.si = si
+        self.estilo = estilo
+        self.hijos = hijos
+        # Texto sin campos: se codifica desde ahora
+        self.estatico = None if self.campos else formato.encode("cp437", errors="replace")
+
+
+def _compilar_lista(elementos):
+    ops = []
+    for e in elementos:
+        if e.get("logo"):
+            ops.append(Op("logo", estilo=comandos_estilo(align="center")))
+        elif e.get("corte"):
+            ops.append(Op("corte"))
+        elif "items" in e:
+            ops.append(Op("items", hijos=_compilar_lista(e["items"])))
+        else:
+            align = e.get("align", "left")
+            formato = e["linea"] * ANCHO if "linea" in e else e["texto"]
+            ops.append(Op(
+                "texto", formato, align=align, si=e.get("si"),
+                estilo=comandos_estilo(
+                    align=align, bold=e.get("bold", False),
+                    width=e.get("width", 1), height=e.get("height", 1)
+                )
+            ))
+    return tuple(ops)
+
+
+@lru_cache(maxsize=None)
+def compilar(nombre):
+    """Representación intermedia de una plantilla (se compila una vez)"""
+    return _compilar_lista(PLANTILLAS[nombre])
+
+
+def _lineas(ops, datos):
+    """Recorre la plantilla y produce (op, texto) ya formateado"""
+    for op in ops:
+        if op.tipo == "items":
+            for item in datos.get("items", []):
+                contexto = dict(datos)
+                contexto.update(item)
+                contexto.setdefault("qty", 1)
+                contexto.setdefault("subtotal", 0)
+                producto = item.get("categoria", "")
+                if item.get("tipo"):
+                    producto += f" - {item['tipo']}"
+                contexto["producto"] = producto
+                yield from _lineas(op.hijos, contexto)
+        elif op.tipo == "texto":
+            if op.si and not datos.get(op.si):
+                continue
+            texto = op.formato.format(**datos) if op.campos else op.formato
+            yield op, texto
+        else:
+            yield op, None
+
+
+# =========================
+# CODIFICADORES
+# =========================
+def a_escpos(nombre, datos, logo=None):
+    """Bytes ESC/POS del recibo completo (un solo buffer)"""
+    buffer = bytearray(ESC + b"@")
+    for op, texto in _lineas(compilar(nombre), datos):
+        if op.tipo == "logo":
+            if logo:
+                buffer += op.estilo + logo + b"\n"
+        elif op.tipo == "corte":
+            buffer += b"\n\n\n" + ESC + b"d\x03" + GS + b"V\x00"
+        else:
+            buffer += op.estilo
+            if op.estatico is not None:
+                buffer += op.estatico
+            else:
+                buffer += texto.encode("cp437", errors="replace")
+            buffer += b"\n"
+    return bytes(buffer)
+
+
+def _alinear(op, texto):
+    # En texto plano todo sale a tamaño normal: se alinea a ANCHO columnas
+    if op.align == "center":
+        return texto.center(ANCHO).rstrip()
+    if op.align == "right":
+        return texto.rjust(ANCHO)
+    return texto
+
+
+def a_vista(nombre, datos):
+    """Texto plano del recibo, con la alineación simulada con espacios"""
+    lineas = [
+        _alinear(op, texto)
+        for op, texto in _lineas(compilar(nombre), datos)
+        if op.tipo == "texto"
+    ]
+    return "\n".join(lineas)
+
+
+def a_texto(nombre, datos):
+    """Texto para Windows RAW: la vista previa más avance y corte de papel"""
+    return a_vista(nombre, datos) + "\n\n\n\n" + "\x1d\x56\x00"
@@ -5,11 +5,13 @@ from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QGridLayout,
     QFrame, QSizePolicy, QMessageBox
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
-from categorias.bebidas import BebidasDialog
+from PyQt5.QtCore import Qt, QTimer
+from dialogos import PoolDialogos, dialogo_de_categoria
 from ticket import TicketWidget
-from registros_semanales import RegistrosSemanalesDialog
+from cola_impresion import COLA
+from monitor_impresora import MONITOR
+import tema
+import imagenes
 
 
 def resource_path(relative_path):
@@ -20,24 +22,49 @@ def resource_path(relative_path):
 
 
 class ImageFrame(QFrame):
+    # Milisegundos sin cambios de tamaño antes de pedir el escalado suave
+    ESPERA_ESCALADO = 150
+
     def __init__(self, image_path):
         super().__init__()
-        self.pixmap = QPixmap(image_path)
+        self.image_path = image_path
+        self.vacia = imagenes.pixmap(image_path).isNull()
         self.bg_label = QLabel(self)
         self.bg_label.lower()
         self.bg_label.setAlignment(Qt.AlignCenter)
 
+        # Maximizar y acomodar el layout disparan muchos resize seguidos;
+        # solo el último pide la versión suave
+        self.timer_escalado = QTimer(self)
+        self.timer_escalado.setSingleShot(True)
+        self.timer_escalado.setInterval(self.ESPERA_ESCALADO)
+        self.timer_escalado.timeout.connect(self.escalar)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if not self.pixmap.isNull():
-            self.bg_label.setGeometry(0, 0, self.width(), self.height())
-            self.bg_label.setPixmap(
-                self.pixmap.scaled(
-                    self.size(),
-                    Qt.KeepAspectRatioByExpanding,
-                    Qt.SmoothTransformation
-                )
-            )
+        if self.vacia:
+            return
+
+        self.bg_label.setGeometry(0, 0, self.width(), self.height())
+
+        escalada = imagenes.en_cache(self.image_path, self.size())
+        if escalada is not None:
+            self.timer_escalado.stop()
+            self.bg_label.setPixmap(escalada)
+            return
+
+        self.bg_label.setPixmap(imagenes.vista_previa(self.image_path, self.size()))
+        self.timer_escalado.start()
+
+    def escalar(self):
+        tamaño = self.size()
+
+        def listo(escalada):
+            # Si mientras tanto cambió el tamaño, ya viene otra en camino
+            if self.size() == tamaño:
+                self.bg_label.setPixmap(escalada)
+
+        imagenes.escalar_en_fondo(self.image_path, tamaño, listo)
 
 
 class POSWindow(QWidget):
@@ -45,7 +72,6 @@ class POSWindow(QWidget):
         super().__init__()
 
         self.setWindowTitle("Punto de Venta - Michel")
-        self.showMaximized()
 
         # ======================================================
         # BARRA SUPERIOR
@@ -56,58 +82,31 @@ class POSWindow(QWidget):
         # Botón de configurar impresora
         self.btn_printer = QPushButton("Impresora")
         self.btn_printer.setFixedHeight(45)
-        self.btn_printer.setStyleSheet("""
-            QPushButton {
-                background-color: #ff9800;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 10px;
-                padding: 8px 18px;
-            }
-            QPushButton:hover {
-                background-color: #e68900;
-            }
-        """)
+        self.btn_printer.setObjectName("btn_impresora")
+        tema.clase(self.btn_printer, "barra")
         self.btn_printer.clicked.connect(self.open_printer_config)
 
         # 🔒 BOTÓN EDITAR MENÚ (OCULTO)
         self.btn_editar_menu = QPushButton("⚙️ Editar Menú")
         self.btn_editar_menu.setFixedHeight(45)
-        self.btn_editar_menu.setStyleSheet("""
-            QPushButton {
-                background-color: #9c27b0;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 10px;
-                padding: 8px 18px;
-            }
-            QPushButton:hover {
-                background-color: #7b1fa2;
-            }
-        """)
+        self.btn_editar_menu.setObjectName("btn_editar_menu")
+        tema.clase(self.btn_editar_menu, "barra")
         self.btn_editar_menu.hide()
         self.btn_editar_menu.clicked.connect(self.open_editar_menu)
 
         # Botón registros semanales
         self.btn_registros = QPushButton("Registros Semanales")
         self.btn_registros.setFixedHeight(45)
-        self.btn_registros.setStyleSheet("""
-            QPushButton {
-                background-color: #2e7d32;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border-radius: 10px;
-                padding: 8px 18px;
-            }
-            QPushButton:hover {
-                background-color: #1b5e20;
-            }
-        """)
+        self.btn_registros.setObjectName("btn_registros")
+        tema.clase(self.btn_registros, "barra")
+
+        # Estado de la impresora (lo actualiza MONITOR en segundo plano)
+        self.lbl_impresora = QLabel()
+        self.lbl_impresora.setObjectName("lbl_impresora")
+        self.lbl_impresora.setAlignment(Qt.AlignCenter)
 
         top_bar.addWidget(self.btn_printer)
+        top_bar.addWidget(self.lbl_impresora)
         top_bar.addWidget(self.btn_editar_menu)
         top_bar.addStretch()
         top_bar.addWidget(self.btn_registros)
@@ -116,12 +115,7 @@ class POSWindow(QWidget):
         # PANEL IZQUIERDO
         # =========================
         products_frame = ImageFrame(resource_path("comidas.jpg"))
-        products_frame.setStyleSheet("""
-            QFrame {
-                border: 2px solid black;
-                border-radius: 14px;
-            }
-        """)
+        tema.clase(products_frame, "panel")
         products_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         products_layout = QVBoxLayout(products_frame)
@@ -131,19 +125,6 @@ class POSWindow(QWidget):
         grid = QGridLayout()
         grid.setSpacing(25)
 
-        btn_style = """
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.93);
-                border: 2px solid black;
-                border-radius: 22px;
-                font-size: 18px;
-                padding: 25px;
-            }
-            QPushButton:hover {
-                background-color: rgba(230, 230, 230, 0.96);
-            }
-        """
-
         self.buttons = {}
 
         categorias = [
@@ -155,7 +136,7 @@ class POSWindow(QWidget):
         row = col = 0
         for nombre in categorias:
             btn = QPushButton(nombre)
-            btn.setStyleSheet(btn_style)
+            tema.clase(btn, "categoria")
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             grid.addWidget(btn, row, col)
             self.buttons[nombre] = btn
@@ -173,13 +154,7 @@ class POSWindow(QWidget):
         # =========================
         ticket_frame = QFrame()
         ticket_frame.setFixedWidth(340)
-        ticket_frame.setStyleSheet("""
-            QFrame {
-                border: 2px solid black;
-                border-radius: 14px;
-                background: white;
-            }
-        """)
+        tema.clase(ticket_frame, "ticket")
 
         ticket_layout = QVBoxLayout(ticket_frame)
         ticket_layout.setContentsMargins(0, 0, 0, 0)
@@ -194,26 +169,12 @@ class POSWindow(QWidget):
         bottom_layout = QHBoxLayout()
         bottom_layout.setSpacing(40)
 
-        btn_bottom_style = """
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border-radius: 12px;
-                padding: 18px 35px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1558b0;
-            }
-        """
-
         self.btn_cancel = QPushButton("Cancelación")
         self.btn_admin = QPushButton("Corte (Admin)")
         self.btn_pay = QPushButton("Pagar / Cobrar")
 
         for btn in (self.btn_cancel, self.btn_admin, self.btn_pay):
-            btn.setStyleSheet(btn_bottom_style)
+            tema.clase(btn, "inferior")
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
         bottom_layout.addWidget(self.btn_cancel)
@@ -261,6 +222,32 @@ class POSWindow(QWidget):
         self._admin_buffer = ""
         self._admin_password = "goku"
 
+        self.dialogos = PoolDialogos(self)
+
+        self.timer_impresora = QTimer(self)
+        self.timer_impresora.timeout.connect(self.actualizar_estado_impresora)
+
+    # =========================
+    # MOSTRAR
+    # =========================
+    def mostrar(self):
+        """
+        Muestra la ventana y arranca los servicios. La ventana se puede
+        construir antes (oculta, mientras se ve el login) y mostrarse
+        hasta que se acepta la contraseña.
+        """
+        self.showMaximized()
+
+        # Diálogos de categoría: se arman una vez, en ratos libres
+        self.dialogos.precalentar()
+
+        # Imprime lo que haya quedado pendiente de la sesión anterior
+        COLA.iniciar()
+
+        MONITOR.iniciar()
+        self.timer_impresora.start(2000)
+        self.actualizar_estado_impresora()
+
     # =========================
     # TECLADO SECRETO 🔒
     # =========================
@@ -290,7 +277,7 @@ class POSWindow(QWidget):
         self.ticket.add_item(data)
 
     def cancel_ticket(self):
-        if not self.ticket.items_data:
+        if not self.ticket.modelo:
             QMessageBox.information(self, "Info", "El ticket ya está vacío")
             return
 
@@ -305,82 +292,39 @@ class POSWindow(QWidget):
             self.ticket.clear()
 
     def edit_product(self, data, row):
-        categoria = data["categoria"]
-
-        if categoria == "Gorditas":
-            from categorias.gorditas import GorditasDialog
-            GorditasDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Bocoles":
-            from categorias.bocoles import BocolesDialog
-            BocolesDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Migadas":
-            from categorias.migadas import MigadasDialog
-            MigadasDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Tacos de Maiz":
-            from categorias.tacosmaiz import TacosDialog
-            TacosDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Tacos de Harina":
-            from categorias.Tacosharina import TacosharinaDialog
-            TacosharinaDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Bebidas":
-            from categorias.bebidas import BebidasDialog
-            BebidasDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Quesadillas":
-            from categorias.quesadillas import QuesadillasDialog
-            QuesadillasDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Big Quesadilla":
-            from categorias.Bigquesadilla import BigQuesadillasDialog
-            BigQuesadillasDialog(self, edit_data=data, edit_row=row).exec_()
-
-        elif categoria == "Postres":
-            from categorias.postres import PostresDialog
-            PostresDialog(self, edit_data=data, edit_row=row).exec_()
+        nombre = dialogo_de_categoria(data["categoria"])
+        if nombre:
+            self.dialogos.abrir(nombre, data, row)
 
     # =========================
     # ABRIR CATEGORÍAS
     # =========================
     def open_gorditas(self):
-        from categorias.gorditas import GorditasDialog
-        GorditasDialog(self).exec_()
+        self.dialogos.abrir("gorditas")
 
     def open_bocoles(self):
-        from categorias.bocoles import BocolesDialog
-        BocolesDialog(self).exec_()
+        self.dialogos.abrir("bocoles")
 
     def open_migadas(self):
-        from categorias.migadas import MigadasDialog
-        MigadasDialog(self).exec_()
+        self.dialogos.abrir("migadas")
 
     def open_tacos_de_maiz(self):
-        from categorias.tacosmaiz import TacosDialog
-        TacosDialog(self).exec_()
+        self.dialogos.abrir("tacos_maiz")
 
     def open_bebidas(self):
-        from categorias.bebidas import BebidasDialog
-        BebidasDialog(self).exec_()
+        self.dialogos.abrir("bebidas")
 
     def open_tacos(self):
-        from categorias.Tacosharina import TacosharinaDialog
-        TacosharinaDialog(self).exec_()
+        self.dialogos.abrir("tacos_harina")
 
     def open_quesadillas(self):
-        from categorias.quesadillas import QuesadillasDialog
-        QuesadillasDialog(self).exec_()
+        self.dialogos.abrir("quesadillas")
 
     def open_bigquesadillas(self):
-        from categorias.Bigquesadilla import BigQuesadillasDialog
-        BigQuesadillasDialog(self).exec_()
+        self.dialogos.abrir("big_quesadilla")
 
     def open_postres(self):
-        from categorias.postres import PostresDialog
-        PostresDialog(self).exec_()
+        self.dialogos.abrir("postres")
 
     def add_cafe(self):
         self.add_product({
@@ -397,6 +341,7 @@ class POSWindow(QWidget):
         try:
             from config_impresora import PrinterConfigDialog
             PrinterConfigDialog(self).exec_()
+            MONITOR.revisar()
         except ImportError:
             QMessageBox.information(
                 self,
@@ -409,8 +354,26 @@ class POSWindow(QWidget):
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error al abrir configuración:\n{e}")
 
+    def actualizar_estado_impresora(self):
+        """Pinta el último estado conocido (sin consultar la impresora)"""
+        estado = MONITOR.estado()
+        texto = f"● {estado['detalle']}"
+
+        # Trabajos que la cola dejó de reintentar
+        apartadas = COLA.apartadas()
+        if apartadas:
+            texto += f" · {apartadas} sin imprimir"
+            self.lbl_impresora.setToolTip(
+                "Hay tickets o cortes que no se pudieron imprimir\n"
+                "(datos dañados o la impresora no respondió)."
+            )
+        self.lbl_impresora.setText(texto)
+        if self.lbl_impresora.property("estado") != estado["estado"]:
+            self.lbl_impresora.setProperty("estado", estado["estado"])
+            tema.repintar(self.lbl_impresora)
+
     def open_payment(self):
-        if not self.ticket.items_data:
+        if not self.ticket.modelo:
             QMessageBox.warning(self, "Atención", "El ticket está vacío")
             return
 
@@ -422,4 +385,5 @@ class POSWindow(QWidget):
         CorteDialog(self, self.ticket).exec_()
 
     def open_registros(self):
+        from registros_semanales import RegistrosSemanalesDialog
         RegistrosSemanalesDialog(self).exec_()
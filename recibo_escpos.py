@@ -0,0 +1,29 @@
+"""
+Comandos ESC/POS de bajo nivel
+Alineación, negritas, tamaño y corte se codifican dentro del mismo
+buffer del recibo, que se manda a la impresora en una sola escritura.
+"""
+
+ESC = b"\x1b"
+GS = b"\x1d"
+
+ALINEACION = {"left": 0, "center": 1, "right": 2}
+
+
+def comandos_estilo(align=None, bold=None, width=None, height=None):
+    """Bytes ESC a / ESC E / GS ! para el estilo pedido"""
+    salida = bytearray()
+    if align is not None:
+        salida += ESC + b"a" + bytes((ALINEACION[align],))
+    if bold is not None:
+        salida += ESC + b"E" + (b"\x01" if bold else b"\x00")
+    if width is not None or height is not None:
+        w = (width or 1) - 1
+        h = (height or 1) - 1
+        salida += GS + b"!" + bytes(((w << 4) | h,))
+    return bytes(salida)
+
+
+def enviar(printer, datos):
+    """Manda el recibo completo con una sola escritura"""
+    printer._raw(datos)
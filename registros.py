@@ -1,35 +1,19 @@
-import json
-from datetime import datetime, timedelta
-import os
-
-ARCHIVO = "ventas.json"
-
-def _leer():
-    if not os.path.exists(ARCHIVO):
-        return []
-    with open(ARCHIVO, "r", encoding="utf-8") as f:
-        return json.load(f)
+from datetime import datetime
+import almacen
 
 def total_hoy():
-    hoy = datetime.now().strftime("%Y-%m-%d")
-    return sum(v["total"] for v in _leer() if v["fecha"] == hoy)
+    claves = almacen.claves_periodo(datetime.now().strftime("%Y-%m-%d"))
+    return almacen.total_resumen("dia", claves["dia"])
 
 def total_semana():
-    hoy = datetime.now()
-    inicio = hoy - timedelta(days=hoy.weekday())
-    return sum(
-        v["total"]
-        for v in _leer()
-        if datetime.strptime(v["fecha"], "%Y-%m-%d") >= inicio
-    )
+    claves = almacen.claves_periodo(datetime.now().strftime("%Y-%m-%d"))
+    return almacen.total_resumen("semana", claves["semana"])
 
 def total_mes():
-    hoy = datetime.now()
-    return sum(
-        v["total"]
-        for v in _leer()
-        if datetime.strptime(v["fecha"], "%Y-%m-%d").month == hoy.month
-    )
+    claves = almacen.claves_periodo(datetime.now().strftime("%Y-%m-%d"))
+    return almacen.total_resumen("mes", claves["mes"])
 
-def listar_cortes():
-    return _leer()
+def listar_cortes(desde=None, hasta=None):
+    if desde is None and hasta is None:
+        return almacen.listar_cortes()
+    return almacen.cortes_between(desde or "0000-01-01", hasta or "9999-12-31")
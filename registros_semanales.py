@@ -3,16 +3,40 @@ from PyQt5.QtWidgets import (
     QLabel, QPushButton, QFrame,
     QComboBox, QFileDialog
 )
-from PyQt5.QtChart import QChart, QChartView, QBarSeries, QBarSet
 from PyQt5.QtGui import QPainter
-from PyQt5.QtCore import Qt
-from datetime import datetime, timedelta
-import json
-from pathlib import Path
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from datetime import datetime
 import calendar
-from fpdf import FPDF
+import agregados
+from hilos import sin_esperar
 
-ARCHIVO = Path("ventas.json")
+
+class CargarRegistrosThread(QThread):
+    """Hilo para leer y agregar las ventas sin bloquear la UI"""
+    cargados = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def run(self):
+        try:
+            self.cargados.emit(agregados.obtener())
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class CargarHistoricoThread(QThread):
+    """Hilo para agregar todos los cortes (reporte de varios años)"""
+    cargado = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def run(self):
+        try:
+            self.cargado.emit(agregados.historico())
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+# Dato del combo de años para el reporte de todos los años
+HISTORICO = 0
 
 
 class RegistrosSemanalesDialog(QDialog):
@@ -22,6 +46,11 @@ class RegistrosSemanalesDialog(QDialog):
         self.setWindowTitle("📊 Registros de Ventas")
         self.setFixedSize(750, 600)
 
+        # Se llenan cuando termina el hilo de carga
+        self.agregados = None
+        self.historico = None
+        self.historico_thread = None
+
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setSpacing(15)
 
@@ -37,8 +66,11 @@ class RegistrosSemanalesDialog(QDialog):
         self.main_layout.addWidget(titulo)
 
         # =========================
-        # SELECTOR DE MES
+        # SELECTOR DE MES Y AÑO
         # =========================
+        selector = QHBoxLayout()
+        selector.setSpacing(15)
+
         self.combo_mes = QComboBox()
         self.combo_mes.setFixedHeight(35)
 
@@ -48,19 +80,26 @@ class RegistrosSemanalesDialog(QDialog):
         self.combo_mes.setCurrentIndex(datetime.now().month - 1)
         self.combo_mes.currentIndexChanged.connect(self.actualizar_vista)
 
-        self.main_layout.addWidget(self.combo_mes)
+        # Los años con ventas se agregan al terminar la carga
+        self.combo_anio = QComboBox()
+        self.combo_anio.setFixedHeight(35)
+        self.combo_anio.addItem(str(datetime.now().year), datetime.now().year)
+        self.combo_anio.currentIndexChanged.connect(self.actualizar_vista)
+
+        selector.addWidget(self.combo_mes, 3)
+        selector.addWidget(self.combo_anio, 1)
+
+        self.main_layout.addLayout(selector)
 
         # =========================
-        # TARJETAS
+        # TARJETAS (en blanco hasta que llegan los datos)
         # =========================
-        totales = self.calcular_totales_hoy()
-
         cards = QHBoxLayout()
         cards.setSpacing(15)
 
-        self.card_dia = self._card("HOY", totales["dia"])
-        self.card_semana = self._card("SEMANA", totales["semana"])
-        self.card_mes = self._card("MES", totales["mes"])
+        self.card_dia = self._card("HOY")
+        self.card_semana = self._card("SEMANA")
+        self.card_mes = self._card("MES")
 
         cards.addWidget(self.card_dia)
         cards.addWidget(self.card_semana)
@@ -71,9 +110,7 @@ class RegistrosSemanalesDialog(QDialog):
         # =========================
         # GRÁFICA
         # =========================
-        self.chart_view = self.crear_grafica_mes(
-            self.calcular_por_mes(datetime.now().month)[1]
-        )
+        self.chart_view = self.crear_grafica_mes({})
         self.main_layout.addWidget(self.chart_view)
 
         # =========================
@@ -95,10 +132,42 @@ class RegistrosSemanalesDialog(QDialog):
 
         self.main_layout.addLayout(btns)
 
+        # =========================
+        # CARGA EN SEGUNDO PLANO
+        # =========================
+        self.status_label = QLabel("Cargando ventas...")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("font-size: 12px; color: #666;")
+        self.main_layout.addWidget(self.status_label)
+
+        self.load_thread = CargarRegistrosThread()
+        self.load_thread.cargados.connect(self.on_registros_cargados)
+        self.load_thread.error.connect(self.on_error_carga)
+        sin_esperar(self.load_thread)
+
+    # =========================
+    # DATOS CARGADOS
+    # =========================
+    def on_registros_cargados(self, datos):
+        """Callback cuando el hilo termina de agregar las ventas"""
+        self.agregados = datos
+        self.status_label.setText("")
+
+        totales = self.calcular_totales_hoy()
+        self._set_card(self.card_dia, totales["dia"])
+        self._set_card(self.card_semana, totales["semana"])
+
+        self.llenar_anios()
+        self.actualizar_vista()
+
+    def on_error_carga(self, error):
+        """Callback en caso de error"""
+        self.status_label.setText(f"Error al cargar ventas: {error}")
+
     # =========================
     # CARD
     # =========================
-    def _card(self, titulo, valor):
+    def _card(self, titulo, valor=None):
         frame = QFrame()
         frame.setStyleSheet("""
             QFrame {
@@ -114,7 +183,7 @@ class RegistrosSemanalesDialog(QDialog):
         lbl_t.setAlignment(Qt.AlignCenter)
         lbl_t.setStyleSheet("font-size: 14px; color: #555;")
 
-        lbl_v = QLabel(f"${valor:.2f}")
+        lbl_v = QLabel("..." if valor is None else f"${valor:.2f}")
         lbl_v.setAlignment(Qt.AlignCenter)
         lbl_v.setStyleSheet("font-size: 20px; font-weight: bold;")
 
@@ -123,85 +192,112 @@ class RegistrosSemanalesDialog(QDialog):
 
         return frame
 
+    def _set_card(self, card, valor):
+        card.findChildren(QLabel)[1].setText(f"${valor:.2f}")
+
+    def _set_titulo(self, card, titulo):
+        card.findChildren(QLabel)[0].setText(titulo)
+
     # =========================
     # TOTALES HOY / SEMANA / MES
     # =========================
     def calcular_totales_hoy(self):
-        if not ARCHIVO.exists():
-            return {"dia": 0, "semana": 0, "mes": 0}
-
-        with open(ARCHIVO, "r", encoding="utf-8") as f:
-            ventas = json.load(f)
-
-        hoy = datetime.now().date()
-        inicio_semana = hoy - timedelta(days=hoy.weekday())
-        inicio_mes = hoy.replace(day=1)
-
-        total_dia = total_semana = total_mes = 0
-
-        for v in ventas:
-            fecha = datetime.strptime(v["fecha"], "%Y-%m-%d").date()
-            total = v["total_vendido"]
-
-            if fecha == hoy:
-                total_dia += total
-            if fecha >= inicio_semana:
-                total_semana += total
-            if fecha >= inicio_mes:
-                total_mes += total
-
-        return {
-            "dia": total_dia,
-            "semana": total_semana,
-            "mes": total_mes
-        }
+        return agregados.totales_hoy(self._datos())
 
     # =========================
     # CÁLCULO POR MES
     # =========================
-    def calcular_por_mes(self, mes):
-        if not ARCHIVO.exists():
-            return 0, {}, {}
+    def calcular_por_mes(self, anio, mes):
+        return agregados.por_mes(self._datos(), anio, mes)
 
-        with open(ARCHIVO, "r", encoding="utf-8") as f:
-            ventas = json.load(f)
+    def _datos(self):
+        # Si el hilo aún no termina (p. ej. exportar de inmediato), leer aquí
+        if self.agregados is None:
+            self.agregados = agregados.obtener()
+        return self.agregados
 
-        total_mes = 0
-        por_dia = {}
-        por_semana = {}
-
-        for v in ventas:
-            fecha = datetime.strptime(v["fecha"], "%Y-%m-%d").date()
-            if fecha.month != mes:
-                continue
-
-            total_mes += v["total_vendido"]
-
-            por_dia[fecha.day] = por_dia.get(fecha.day, 0) + v["total_vendido"]
-            semana = fecha.isocalendar()[1]
-            por_semana[semana] = por_semana.get(semana, 0) + v["total_vendido"]
-
-        return total_mes, por_dia, por_semana
+    # =========================
+    # AÑOS DISPONIBLES
+    # =========================
+    def llenar_anios(self):
+        actual = self.combo_anio.currentData()
+        if actual == HISTORICO:
+            actual = datetime.now().year
+        anios = sorted(set(self.agregados.anios) | {actual}, reverse=True)
+
+        self.combo_anio.blockSignals(True)
+        self.combo_anio.clear()
+        for anio in anios:
+            self.combo_anio.addItem(str(anio), anio)
+        self.combo_anio.addItem("Todos los años", HISTORICO)
+        self.combo_anio.setCurrentIndex(anios.index(actual))
+        self.combo_anio.blockSignals(False)
 
     # =========================
     # ACTUALIZAR VISTA
     # =========================
     def actualizar_vista(self):
+        if self.agregados is None:
+            return
+
+        anio = self.combo_anio.currentData()
+        self.combo_mes.setEnabled(anio != HISTORICO)
+
+        if anio == HISTORICO:
+            self.mostrar_historico()
+            return
+
         mes = self.combo_mes.currentData()
-        total_mes, por_dia, _ = self.calcular_por_mes(mes)
+        total_mes, por_dia, _ = self.calcular_por_mes(anio, mes)
 
-        self.card_mes.findChildren(QLabel)[1].setText(f"${total_mes:.2f}")
+        self._set_titulo(self.card_mes, "MES")
+        self._set_card(self.card_mes, total_mes)
+        self._cambiar_grafica(self.crear_grafica_mes(por_dia))
 
+    def _cambiar_grafica(self, view):
         self.main_layout.removeWidget(self.chart_view)
         self.chart_view.deleteLater()
 
-        self.chart_view = self.crear_grafica_mes(por_dia)
+        self.chart_view = view
         self.main_layout.insertWidget(3, self.chart_view)
 
+    # =========================
+    # HISTÓRICO (TODOS LOS AÑOS)
+    # =========================
+    def mostrar_historico(self):
+        if self.historico is None:
+            # Se calcula desde los cortes crudos una vez por apertura
+            if self.historico_thread is None:
+                self.status_label.setText("Calculando histórico...")
+                self.historico_thread = CargarHistoricoThread()
+                self.historico_thread.cargado.connect(self.on_historico_cargado)
+                self.historico_thread.error.connect(self.on_error_carga)
+                sin_esperar(self.historico_thread)
+            return
+
+        self._set_titulo(self.card_mes, "TOTAL")
+        self._set_card(self.card_mes, sum(self.historico.anios.values()))
+        self._cambiar_grafica(self.crear_grafica_anios(self.historico.anios))
+
+    def on_historico_cargado(self, datos):
+        self.historico = datos
+        self.status_label.setText("")
+        if self.combo_anio.currentData() == HISTORICO:
+            self.mostrar_historico()
+
+    def _historico(self):
+        # Igual que _datos(): si el hilo aún no termina, calcular aquí
+        if self.historico is None:
+            self.historico = agregados.historico()
+        return self.historico
+
     # =========================
     # GRÁFICA DEL MES
     # =========================
     def crear_grafica_mes(self, por_dia):
+        # QtChart es pesado: se carga hasta que se abre el reporte
+        from PyQt5.QtChart import QChart, QChartView, QBarSeries, QBarSet
+
         series = QBarSeries()
         bar = QBarSet("Ventas del Mes")
 
@@ -220,6 +316,36 @@ class RegistrosSemanalesDialog(QDialog):
         view.setRenderHint(QPainter.Antialiasing)
         return view
 
+    # =========================
+    # GRÁFICA POR AÑO
+    # =========================
+    def crear_grafica_anios(self, por_anio):
+        from PyQt5.QtChart import (
+            QChart, QChartView, QBarSeries, QBarSet, QBarCategoryAxis
+        )
+
+        anios = sorted(por_anio)
+        series = QBarSeries()
+        bar = QBarSet("Ventas por Año")
+
+        for anio in anios:
+            bar.append(por_anio[anio])
+
+        series.append(bar)
+
+        chart = QChart()
+        chart.addSeries(series)
+        chart.setTitle("Ventas por Año")
+        chart.createDefaultAxes()
+        eje = QBarCategoryAxis()
+        eje.append([str(anio) for anio in anios])
+        chart.setAxisX(eje, series)
+        chart.legend().setVisible(False)
+
+        view = QChartView(chart)
+        view.setRenderHint(QPainter.Antialiasing)
+        return view
+
     # =========================
     # EXPORTAR PDF
     # =========================
@@ -230,15 +356,24 @@ class RegistrosSemanalesDialog(QDialog):
         if not path:
             return
 
-        mes_num = self.combo_mes.currentData()
-        mes_nombre = self.combo_mes.currentText()
-        total_mes, por_dia, por_semana = self.calcular_por_mes(mes_num)
+        anio = self.combo_anio.currentData()
+
+        from fpdf import FPDF
 
         pdf = FPDF()
         pdf.add_page()
         pdf.set_font("Arial", size=12)
 
-        pdf.cell(0, 10, f"REPORTE DE VENTAS - {mes_nombre}", ln=True)
+        if anio == HISTORICO:
+            self._pdf_historico(pdf)
+            pdf.output(path)
+            return
+
+        mes_num = self.combo_mes.currentData()
+        mes_nombre = self.combo_mes.currentText()
+        total_mes, por_dia, por_semana = self.calcular_por_mes(anio, mes_num)
+
+        pdf.cell(0, 10, f"REPORTE DE VENTAS - {mes_nombre} {anio}", ln=True)
         pdf.ln(5)
         pdf.cell(0, 8, f"Total del mes: ${total_mes:.2f}", ln=True)
         pdf.ln(5)
@@ -253,3 +388,20 @@ class RegistrosSemanalesDialog(QDialog):
             pdf.cell(0, 8, f"Día {d}: ${t:.2f}", ln=True)
 
         pdf.output(path)
+
+    def _pdf_historico(self, pdf):
+        historico = self._historico()
+
+        pdf.cell(0, 10, "REPORTE DE VENTAS - HISTÓRICO", ln=True)
+        pdf.ln(5)
+        pdf.cell(0, 8, f"Total: ${sum(historico.anios.values()):.2f}", ln=True)
+        pdf.ln(5)
+
+        pdf.cell(0, 8, "Ventas por año:", ln=True)
+        for a, t in sorted(historico.anios.items()):
+            pdf.cell(0, 8, f"{a}: ${t:.2f}", ln=True)
+
+        pdf.ln(5)
+        pdf.cell(0, 8, "Ventas por mes:", ln=True)
+        for (a, m), t in sorted(historico.meses.items()):
+            pdf.cell(0, 8, f"{calendar.month_name[m]} {a}: ${t:.2f}", ln=True)
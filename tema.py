@@ -0,0 +1,238 @@
+"""
+Tema visual de la aplicación
+Una sola hoja de estilo instalada en QApplication al arrancar; Qt la
+interpreta una vez por proceso. Los widgets solo declaran qué son con
+un nombre de objeto o con la propiedad "clase":
+
+    tema.clase(boton, "primario")
+"""
+
+AZUL = "#1a73e8"
+AZUL_OSCURO = "#1558b0"
+ROJO = "#d93025"
+VERDE = "#2e7d32"
+AMARILLO = "#f9a825"
+GRIS = "#757575"
+FONDO_DIALOGO = "#f8f9fa"
+
+HOJA = f"""
+/* =========================
+   LOGIN
+   ========================= */
+QLabel[clase="login"] {{ color: black; }}
+QLineEdit[clase="login"] {{
+    border-radius: 22px;
+    padding-left: 15px;
+    font-size: 16px;
+    background: white;
+}}
+QPushButton[clase="login"] {{
+    background-color: {AZUL};
+    color: white;
+    border-radius: 25px;
+    font-size: 18px;
+    font-weight: bold;
+}}
+QPushButton[clase="login"]:hover {{ background-color: {AZUL_OSCURO}; }}
+
+/* =========================
+   VENTANA PRINCIPAL
+   ========================= */
+QPushButton[clase="barra"] {{
+    color: white;
+    font-size: 14px;
+    font-weight: bold;
+    border-radius: 10px;
+    padding: 8px 18px;
+}}
+QPushButton#btn_impresora {{ background-color: #ff9800; }}
+QPushButton#btn_impresora:hover {{ background-color: #e68900; }}
+QPushButton#btn_editar_menu {{ background-color: #9c27b0; }}
+QPushButton#btn_editar_menu:hover {{ background-color: #7b1fa2; }}
+QPushButton#btn_registros {{ background-color: {VERDE}; }}
+QPushButton#btn_registros:hover {{ background-color: #1b5e20; }}
+
+QLabel#lbl_impresora {{
+    color: {GRIS};
+    font-size: 14px;
+    font-weight: bold;
+}}
+QLabel#lbl_impresora[estado="lista"] {{ color: {VERDE}; }}
+QLabel#lbl_impresora[estado="poco_papel"] {{ color: {AMARILLO}; }}
+QLabel#lbl_impresora[estado="sin_papel"],
+QLabel#lbl_impresora[estado="error"],
+QLabel#lbl_impresora[estado="desconectada"] {{ color: {ROJO}; }}
+
+QFrame[clase="panel"],
+QFrame[clase="panel"] QFrame {{
+    border: 2px solid black;
+    border-radius: 14px;
+}}
+
+QFrame[clase="ticket"],
+QFrame[clase="ticket"] QFrame {{
+    border: 2px solid black;
+    border-radius: 14px;
+    background: white;
+}}
+
+QPushButton[clase="categoria"] {{
+    background-color: rgba(255, 255, 255, 0.93);
+    border: 2px solid black;
+    border-radius: 22px;
+    font-size: 18px;
+    padding: 25px;
+}}
+QPushButton[clase="categoria"]:hover {{
+    background-color: rgba(230, 230, 230, 0.96);
+}}
+
+QPushButton[clase="inferior"] {{
+    background-color: {AZUL};
+    color: white;
+    border-radius: 12px;
+    padding: 18px 35px;
+    font-size: 18px;
+    font-weight: bold;
+}}
+QPushButton[clase="inferior"]:hover {{ background-color: {AZUL_OSCURO}; }}
+
+/* =========================
+   TICKET
+   ========================= */
+QLabel[clase="encabezado"] {{
+    font-size: 18px;
+    font-weight: bold;
+}}
+QListView[clase="ticket"] {{ font-size: 15px; }}
+QListView[clase="ticket"]::item:selected {{
+    background: {AZUL};
+    color: white;
+}}
+QPushButton[clase="peligro"] {{
+    background-color: {ROJO};
+    color: white;
+    border-radius: 10px;
+    padding: 10px;
+    font-weight: bold;
+}}
+
+/* =========================
+   DIÁLOGOS DE PRODUCTO
+   ========================= */
+QFrame[clase="tarjeta"],
+QFrame[clase="tarjeta"] QFrame {{
+    background-color: {FONDO_DIALOGO};
+    border-radius: 20px;
+}}
+
+QLabel[clase="titulo"] {{
+    font-size: 26px;
+    font-weight: bold;
+}}
+
+QComboBox[clase="opciones"] {{
+    font-size: 18px;
+    padding: 12px;
+    border-radius: 14px;
+    border: 2px solid #ccc;
+}}
+
+QPushButton[clase="contador"] {{
+    font-size: 28px;
+    font-weight: bold;
+    border-radius: 30px;
+    background-color: #e0e0e0;
+}}
+QLabel[clase="contador"] {{
+    font-size: 26px;
+    font-weight: bold;
+}}
+
+QLabel[clase="precio"] {{
+    font-size: 20px;
+    font-weight: bold;
+    color: {AZUL};
+}}
+
+QPushButton[clase="primario"] {{
+    background-color: {AZUL};
+    color: white;
+    border-radius: 16px;
+    font-size: 20px;
+    font-weight: bold;
+}}
+QPushButton[clase="primario"]:hover {{ background-color: {AZUL_OSCURO}; }}
+
+QPushButton[clase="opcion"] {{
+    background-color: {AZUL};
+    color: white;
+    border-radius: 18px;
+    font-size: 20px;
+    font-weight: bold;
+}}
+QPushButton[clase="opcion"]:hover {{ background-color: {AZUL_OSCURO}; }}
+
+QPushButton[clase="postre"] {{
+    background-color: {AZUL};
+    color: white;
+    border-radius: 14px;
+    padding: 18px;
+    font-size: 18px;
+    font-weight: bold;
+}}
+QPushButton[clase="postre"]:hover {{ background-color: {AZUL_OSCURO}; }}
+
+/* =========================
+   PAGO
+   ========================= */
+QLabel[clase="subtitulo"] {{
+    font-size: 22px;
+    font-weight: bold;
+}}
+QLabel[clase="total"] {{
+    font-size: 32px;
+    font-weight: bold;
+    color: {AZUL};
+}}
+QCheckBox[clase="imprimir"] {{
+    font-size: 16px;
+    padding: 10px;
+}}
+QCheckBox[clase="imprimir"]::indicator {{
+    width: 22px;
+    height: 22px;
+}}
+QPushButton[clase="confirmar"] {{
+    background-color: {AZUL};
+    color: white;
+    font-size: 18px;
+    font-weight: bold;
+    border-radius: 16px;
+}}
+QPushButton[clase="confirmar"]:hover {{ background-color: {AZUL_OSCURO}; }}
+QPushButton[clase="secundario"] {{
+    background-color: #e0e0e0;
+    color: #333;
+    font-size: 14px;
+    border-radius: 10px;
+}}
+QPushButton[clase="secundario"]:hover {{ background-color: #ccc; }}
+"""
+
+
+def aplicar(app):
+    """Instala la hoja de estilo en la aplicación (una vez al arrancar)"""
+    app.setStyleSheet(HOJA)
+
+
+def clase(widget, nombre):
+    """Marca el widget con una clase del tema y lo regresa"""
+    widget.setProperty("clase", nombre)
+    return widget
+
+
+def repintar(widget):
+    """Vuelve a aplicar el tema tras cambiar una propiedad del widget"""
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
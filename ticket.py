@@ -1,10 +1,59 @@
 # ticket.py (corregido)
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel,
-    QListWidget, QListWidgetItem,
-    QPushButton, QMessageBox
+    QListView, QPushButton, QMessageBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from modelo_ticket import LineItem, Ticket, Corte
+import tema
+
+
+class ModeloLista(QAbstractListModel):
+    """
+    Vista Qt del modelo_ticket.Ticket. El texto de cada renglón se arma
+    hasta que la vista lo pide, y solo se avisa del renglón que cambió,
+    así agregar o editar cuesta lo mismo con 5 productos que con 500.
+    """
+
+    def __init__(self, ticket, parent=None):
+        super().__init__(parent)
+        self.ticket = ticket
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ticket)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.ticket[index.row()].texto()
+        return None
+
+    # =========================
+    # CAMBIOS
+    # =========================
+    def agregar(self, items):
+        """Agrega varios renglones con un solo aviso a la vista"""
+        if not items:
+            return
+        fila = len(self.ticket)
+        self.beginInsertRows(QModelIndex(), fila, fila + len(items) - 1)
+        for item in items:
+            self.ticket.agregar(item)
+        self.endInsertRows()
+
+    def reemplazar(self, row, item):
+        self.ticket.reemplazar(row, item)
+        indice = self.index(row)
+        self.dataChanged.emit(indice, indice, [Qt.DisplayRole])
+
+    def quitar(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.ticket.quitar(row)
+        self.endRemoveRows()
+
+    def limpiar(self):
+        self.beginResetModel()
+        self.ticket.limpiar()
+        self.endResetModel()
 
 
 class TicketWidget(QWidget):
@@ -14,12 +63,10 @@ class TicketWidget(QWidget):
     def __init__(self):
         super().__init__()
 
-        self.total = 0.0
-        self.items_data = []
+        self.modelo = Ticket()
 
-          # === CORTE DEL DÍA ===
-        self.total_vendido = 0.0
-        self.tickets_pagados = 0
+        # === CORTE DEL DÍA ===
+        self.corte = Corte()
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -27,39 +74,25 @@ class TicketWidget(QWidget):
 
         title = QLabel("TICKET")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        tema.clase(title, "encabezado")
+
+        self.lista = ModeloLista(self.modelo, self)
 
-        self.list = QListWidget()
-        self.list.itemDoubleClicked.connect(self._request_edit)
+        self.list = QListView()
+        self.list.setModel(self.lista)
+        # Todos los renglones miden lo mismo: la vista no mide uno por uno
+        self.list.setUniformItemSizes(True)
+        self.list.doubleClicked.connect(self._request_edit)
 
-        self.list.setStyleSheet("""
-            QListWidget {
-                font-size: 15px;
-            }
-            QListWidget::item:selected {
-                background: #1a73e8;
-                color: white;
-            }
-        """)
+        tema.clase(self.list, "ticket")
 
         self.btn_remove = QPushButton("❌ Quitar producto")
-        self.btn_remove.setStyleSheet("""
-            QPushButton {
-                background-color: #d93025;
-                color: white;
-                border-radius: 10px;
-                padding: 10px;
-                font-weight: bold;
-            }
-        """)
+        tema.clase(self.btn_remove, "peligro")
         self.btn_remove.clicked.connect(self.remove_selected)
 
         self.total_label = QLabel("Total: $0.00")
         self.total_label.setAlignment(Qt.AlignRight)
-        self.total_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-        """)
+        tema.clase(self.total_label, "encabezado")
 
         layout.addWidget(title)
         layout.addWidget(self.list)
@@ -78,80 +111,44 @@ class TicketWidget(QWidget):
             "price": 35
         }
         """
-        qty = data["qty"]
-        categoria = data["categoria"]
-        tipo = data.get("tipo", "")  # opcional
-        subtotal = qty * data["price"]
-
-        self.items_data.append({
-            "categoria": categoria,
-            "tipo": tipo,
-            "qty": qty,
-            "price": data["price"],
-            "subtotal": subtotal
-        })
-
-        item_text = f"{qty} x {categoria}"
-        if tipo:
-            item_text += f" - {tipo}"
-        item_text += f"     ${subtotal:.2f}"
-
-        self.list.addItem(item_text)
-        self.total += subtotal
+        self.add_items([data])
+
+    def add_items(self, datos):
+        """Varios productos de una vez (pedidos grandes): un solo repintado"""
+        self.lista.agregar([LineItem.de_dict(data) for data in datos])
         self._update_total()
 
     # =========================
     # SOLICITAR EDICIÓN
     # =========================
-    def _request_edit(self):
-        row = self.list.currentRow()
+    def _request_edit(self, index):
+        row = index.row()
         if row >= 0:
-            self.edit_requested.emit(self.items_data[row], row)
+            self.edit_requested.emit(self.modelo[row].to_dict(), row)
 
     # =========================
     # QUITAR PRODUCTO
     # =========================
     def remove_selected(self):
-        row = self.list.currentRow()
+        row = self.list.currentIndex().row()
         if row < 0:
             QMessageBox.warning(self, "Atención", "Selecciona un producto")
             return
 
-        removed = self.items_data.pop(row)
-        self.total -= removed["subtotal"]
-        self.list.takeItem(row)
+        self.lista.quitar(row)
         self._update_total()
 
     # =========================
     # REEMPLAZAR PRODUCTO (EDICIÓN)
     # =========================
     def replace_item(self, row, data):
-        old = self.items_data[row]
-        self.total -= old["subtotal"]
-
-        subtotal = data["qty"] * data["price"]
-        data["subtotal"] = subtotal
-
-        self.items_data[row] = data
-
-        item_text = f"{data['qty']} x {data['categoria']}"
-        if data.get("tipo"):
-            item_text += f" - {data['tipo']}"
-        item_text += f"     ${subtotal:.2f}"
-
-        self.list.item(row).setText(item_text)
-
-        self.total += subtotal
+        self.lista.reemplazar(row, LineItem.de_dict(data))
         self._update_total()
 
     # =========================
     def clear(self):
-        self.list.clear()
-        self.items_data.clear()
-        self.total = 0
+        self.lista.limpiar()
         self._update_total()
 
     def _update_total(self):
-        if self.total < 0:
-            self.total = 0
-        self.total_label.setText(f"Total: ${self.total:.2f}")
+        self.total_label.setText(f"Total: ${self.modelo.total:.2f}")